@@ -0,0 +1,170 @@
+import mmap
+import os
+import struct
+import sys
+
+TABLES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tables.bin")
+MAGIC = b"ECFGTBL\0"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sII")
+SECTION = struct.Struct("<16s8sQQQ")
+ALIGNMENT = 64
+NUMERIC_COLUMNS = [
+    "atomic-mass", "boil", "density", "melt", "molar-heat", "number", "period", "phase", "category", "x", "y",
+]
+# Format characters accepted by memoryview.cast for each stored dtype
+MEMORYVIEW_FORMATS = {"<f8": "d", "<i2": "h", "<i4": "i", "|u1": "B"}
+
+
+def build_sections() -> dict:
+    import numpy as np
+
+    from dataset import get_dataset
+    from species import ION_OCCUPANCY_MATRIX, OCCUPANCY_MATRIX, SPECIES_ATOMIC_NUMBERS, SPECIES_CHARGES
+
+    dataset = get_dataset()
+    rows = max(dataset.elements) + 1
+    sections = {}
+    for column in NUMERIC_COLUMNS:
+        values = np.full(rows, np.nan)
+        for atomic_number, data in dataset.elements.items():
+            # Missing values, and the odd non-numeric entry such as Cn's phase, are stored as NaN
+            values[atomic_number] = data.get(column) if isinstance(data.get(column), (int, float)) else np.nan
+        sections[column] = values.astype("<f8")
+    sections["symbols"] = np.array([""] + [dataset.elements[number]["symbol"] for number in range(1, rows)], dtype="S2")
+    sections["names"] = np.array([""] + [dataset.elements[number]["name"] for number in range(1, rows)], dtype="S16")
+    names = sorted(dataset.name_to_number)
+    sections["name-index"] = np.array(names, dtype="S16")
+    sections["name-numbers"] = np.array([dataset.name_to_number[name] for name in names], dtype="<i2")
+    sections["species-numbers"] = SPECIES_ATOMIC_NUMBERS.astype("<i2")
+    sections["species-charges"] = SPECIES_CHARGES.astype("<i2")
+    sections["species-starts"] = np.searchsorted(SPECIES_ATOMIC_NUMBERS, np.arange(rows + 1)).astype("<i4")
+    sections["occupancies"] = OCCUPANCY_MATRIX.astype("|u1")
+    sections["ion-occupancies"] = ION_OCCUPANCY_MATRIX.astype("|u1")
+    return sections
+
+
+def write_tables(path: str = TABLES_FILE):
+    sections = build_sections()
+    directory_end = HEADER.size + SECTION.size * len(sections)
+    offset = -(-directory_end // ALIGNMENT) * ALIGNMENT
+    entries, payloads = [], []
+    for name, array in sections.items():
+        columns = array.shape[1] if array.ndim > 1 else 1
+        entries.append(SECTION.pack(name.encode(), array.dtype.str.encode(), offset, array.shape[0], columns))
+        payloads.append((offset, array.tobytes()))
+        offset = -(-(offset + array.nbytes) // ALIGNMENT) * ALIGNMENT
+    # Written to a temporary file and renamed so readers never map a half-written table
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(sections)))
+        file.write(b"".join(entries))
+        for start, payload in payloads:
+            file.seek(start)
+            file.write(payload)
+        file.truncate(offset)
+    os.replace(temporary, path)
+
+
+class BinaryTables:
+    def __init__(self, path: str = TABLES_FILE):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+        magic, version, count = HEADER.unpack_from(self._buffer)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an element table file.")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path} has table format {version}, expected {FORMAT_VERSION}.")
+        self.sections = {}
+        for index in range(count):
+            name, dtype, offset, rows, columns = SECTION.unpack_from(self._buffer, HEADER.size + index * SECTION.size)
+            self.sections[name.rstrip(b"\0").decode()] = (dtype.rstrip(b"\0").decode(), offset, rows, columns)
+
+    def raw(self, name: str) -> memoryview:
+        dtype, offset, rows, columns = self.sections[name]
+        item_size = int(dtype[2:])
+        return self._buffer[offset : offset + rows * columns * item_size]
+
+    def view(self, name: str) -> memoryview:
+        dtype, _, rows, columns = self.sections[name]
+        if dtype not in MEMORYVIEW_FORMATS:
+            return self.raw(name)
+        shape = [rows, columns] if columns > 1 else [rows]
+        return self.raw(name).cast(MEMORYVIEW_FORMATS[dtype], shape)
+
+    def array(self, name: str):
+        import numpy as np
+
+        dtype, _, rows, columns = self.sections[name]
+        array = np.frombuffer(self._buffer, dtype=dtype, count=rows * columns, offset=self.sections[name][1])
+        return array.reshape(rows, columns) if columns > 1 else array
+
+    def atomic_number(self, name: str) -> int | None:
+        # Binary search over the sorted fixed-width name index, straight from the mapping
+        key = name.lower().encode()
+        names, low, high = self.raw("name-index"), 0, self.sections["name-index"][2]
+        while low < high:
+            middle = (low + high) // 2
+            if bytes(names[middle * 16 : middle * 16 + 16]).rstrip(b"\0") < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.sections["name-index"][2] and bytes(names[low * 16 : low * 16 + 16]).rstrip(b"\0") == key:
+            return self.view("name-numbers")[low]
+        symbols = self.raw("symbols")
+        for number in range(1, self.sections["symbols"][2]):
+            if bytes(symbols[number * 2 : number * 2 + 2]).rstrip(b"\0").lower() == key:
+                return number
+        return None
+
+    def occupancy(self, atomic_number: int, charge: int = 0, ion: bool = True) -> tuple[int, ...]:
+        starts = self.view("species-starts")
+        first = starts[atomic_number]
+        row = first + charge - self.view("species-charges")[first]
+        if not first <= row < starts[atomic_number + 1]:
+            raise KeyError((atomic_number, charge))
+        name = "ion-occupancies" if ion else "occupancies"
+        columns = self.sections[name][3]
+        return tuple(self.raw(name)[row * columns : (row + 1) * columns])
+
+    def close(self):
+        # Results of raw(), view() and array() share the mapping, which cannot be unmapped while any is alive;
+        # the tables then stay open and usable
+        self._buffer.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            self._buffer = memoryview(self._mmap)
+            raise BufferError("Views or arrays of the tables are still in use; delete them before close().") from None
+
+
+def benchmark(path: str = TABLES_FILE, runs: int = 20) -> dict:
+    # Cold start: each sample is a fresh interpreter answering one query
+    import subprocess
+    import time
+
+    if not os.path.exists(path):
+        write_tables(path)
+    commands = {
+        "import periodictable": "import periodictable; periodictable.ELEMENTS_DATA[26]['atomic-mass']",
+        "import species": "import species; species.ION_OCCUPANCY_MATRIX[species.SPECIES_INDEX[26, 3]]",
+        "mmap tables": f"from binarytables import BinaryTables; BinaryTables({str(path)!r}).occupancy(26, 3)",
+    }
+    timings = {}
+    for label, command in commands.items():
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", command], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+            samples.append(time.perf_counter() - start)
+        timings[label] = sorted(samples)[runs // 2]
+    return timings
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        for label, seconds in benchmark().items():
+            print(f"{label}: {seconds * 1000:.1f} ms")
+    else:
+        write_tables(sys.argv[1] if len(sys.argv) > 1 else TABLES_FILE)
@@ -8,6 +8,7 @@ DEFAULT_SETTINGS = {
     "button_color": "#D7CA38",
     "entry_and_label_color": "#FFFEEA",
     "text_color": "#000000",
+    "orbital_diagram": False,
 }
 
 
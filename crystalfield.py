@@ -0,0 +1,64 @@
+import numpy as np
+
+from electrons import D_SUBSHELLS
+from species import ION_OCCUPANCY_MATRIX, SPECIES_INDEX
+
+
+# Splitting levels as (label, orbital count, energy in units of that geometry's Δ), lowest first
+GEOMETRY_LEVELS = {
+    "octahedral": (("t2g", 3, -0.4), ("eg", 2, 0.6)),
+    "tetrahedral": (("e", 2, -0.6), ("t2", 3, 0.4)),
+    "square-planar": (("eg", 2, -0.514), ("a1g", 1, -0.428), ("b2g", 1, 0.228), ("b1g", 1, 1.228)),
+}
+SPINS = ("high", "low")
+
+
+def fill_levels(d_count: int, levels, spin: str) -> tuple[int, ...]:
+    occupancy = [0] * len(levels)
+    if spin == "low":
+        for index, (_, orbital_count, _) in enumerate(levels):
+            occupancy[index] = min(d_count - sum(occupancy), 2 * orbital_count)
+        return tuple(occupancy)
+    # High spin puts one electron in every orbital before pairing, lowest levels first in both passes
+    remaining = d_count
+    for _ in range(2):
+        for index, (_, orbital_count, _) in enumerate(levels):
+            added = min(remaining, orbital_count)
+            occupancy[index] += added
+            remaining -= added
+    return tuple(occupancy)
+
+
+def build_crystal_field_table() -> dict:
+    table = {}
+    for geometry, levels in GEOMETRY_LEVELS.items():
+        for spin in SPINS:
+            for d_count in range(11):
+                occupancy = fill_levels(d_count, levels, spin)
+                unpaired = sum(min(electrons, 2 * level[1] - electrons) for electrons, level in zip(occupancy, levels))
+                cfse = round(sum(electrons * level[2] for electrons, level in zip(occupancy, levels)), 3) + 0.0
+                # Pairings beyond those of the free ion, each costing one pairing energy P
+                extra_pairs = (d_count - unpaired) // 2 - max(d_count - 5, 0)
+                table[d_count, geometry, spin] = {
+                    "levels": dict(zip((level[0] for level in levels), occupancy)),
+                    "cfse": cfse,
+                    "pairings": extra_pairs,
+                    "unpaired": unpaired,
+                }
+    return table
+
+
+CRYSTAL_FIELD_TABLE = build_crystal_field_table()
+
+# Outermost occupied d subshell of every species' ion configuration
+D_OCCUPANCIES = ION_OCCUPANCY_MATRIX[:, D_SUBSHELLS]
+D_ELECTRON_COUNTS = D_OCCUPANCIES[np.arange(len(D_OCCUPANCIES)), np.argmax(D_OCCUPANCIES > 0, axis=1)]
+D_ELECTRON_COUNTS.flags.writeable = False
+
+
+def get_d_electron_count(atomic_number: int, charge: int = 0) -> int:
+    return int(D_ELECTRON_COUNTS[SPECIES_INDEX[atomic_number, charge]])
+
+
+def get_crystal_field(atomic_number: int, charge: int, geometry: str = "octahedral", spin: str = "high") -> dict:
+    return CRYSTAL_FIELD_TABLE[get_d_electron_count(atomic_number, charge), geometry, spin]
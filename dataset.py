@@ -0,0 +1,174 @@
+import hashlib
+import json
+import os
+import pickle
+import threading
+
+import numpy as np
+
+from periodictable import ELEMENT_NAME_TO_NUMBER, ELEMENTS_DATA, Category, Phase
+
+
+CACHE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".dataset-cache")
+CACHE_VERSION = 2
+READ_SIZE = 1 << 16
+# Upstream field names that differ from the keys used in ELEMENTS_DATA beyond "_" -> "-"
+RENAMED_FIELDS = {"xpos": "x", "ypos": "y"}
+CATEGORIES = {name.lower().replace("_", " "): value for name, value in vars(Category).items() if name.isupper()}
+CATEGORIES["polyatomic nonmetal"] = Category.NONMETAL
+PHASES = {name.lower(): value for name, value in vars(Phase).items() if name.isupper()}
+
+
+class Dataset:
+    def __init__(self, elements: dict, version: str):
+        self.elements = elements
+        self.version = version
+        # The Slovak and Latin aliases stay valid because a dataset keeps the same atomic numbers
+        self.name_to_number = {**ELEMENT_NAME_TO_NUMBER}
+        self.name_to_number.update({data["name"].lower(): number for number, data in elements.items()})
+        self.symbol_to_number = {data["symbol"]: number for number, data in elements.items()}
+        self.atomic_masses = np.full(max(elements) + 1, np.nan)
+        for number, data in elements.items():
+            if isinstance(data.get("atomic-mass"), (int, float)):
+                self.atomic_masses[number] = data["atomic-mass"]
+        self.atomic_masses.flags.writeable = False
+        self._derived = {}
+
+    def derive(self, key: str, build):
+        # Tables other modules build from this dataset on first use; a swap publishes a new Dataset,
+        # so they are rebuilt lazily against the new data
+        if key not in self._derived:
+            self._derived[key] = build(self)
+        return self._derived[key]
+
+
+def normalize_element(raw: dict) -> dict:
+    element = {RENAMED_FIELDS.get(key, key.replace("_", "-")): value for key, value in raw.items()}
+    if isinstance(element.get("category"), str):
+        category = element["category"].lower()
+        element["category"] = CATEGORIES.get(category, Category.UNKNOWN)
+    if isinstance(element.get("phase"), str):
+        element["phase"] = PHASES.get(element["phase"].lower(), element["phase"])
+    return element
+
+
+def iter_json_elements(path: str):
+    # Decodes one element object at a time from the "elements" list of a top-level object, or from a bare
+    # top-level list, so memory stays at one record; other top-level values are decoded and skipped
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8") as file:
+        buffer = ""
+
+        def peek() -> str:
+            nonlocal buffer
+            buffer = buffer.lstrip()
+            while not buffer:
+                chunk = file.read(READ_SIZE)
+                if not chunk:
+                    raise ValueError(f"{path} has no element list.")
+                buffer = chunk.lstrip()
+            return buffer[0]
+
+        def expect(characters: str) -> str:
+            nonlocal buffer
+            character = peek()
+            if character not in characters:
+                raise ValueError(f"{path}: expected one of {characters!r}, found {character!r}.")
+            buffer = buffer[1:]
+            return character
+
+        def decode():
+            nonlocal buffer
+            peek()
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer)
+                except json.JSONDecodeError:
+                    end = None
+                # A value that reaches the end of the buffer, such as a number, may continue in the next chunk
+                if end is None or end == len(buffer):
+                    chunk = file.read(READ_SIZE)
+                    if chunk:
+                        buffer += chunk
+                        continue
+                    if end is None:
+                        raise ValueError(f"{path} is not valid JSON.")
+                buffer = buffer[end:]
+                return value
+
+        if peek() == "{":
+            expect("{")
+            while True:
+                if peek() == "}":
+                    raise ValueError(f"{path} has no element list.")
+                key = decode()
+                expect(":")
+                if key == "elements":
+                    break
+                decode()
+                if expect(",}") == "}":
+                    raise ValueError(f"{path} has no element list.")
+        expect("[")
+        if peek() == "]":
+            return
+        while True:
+            yield decode()
+            if expect(",]") == "]":
+                return
+
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(READ_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_dataset(path: str, cache_directory: str | None = CACHE_DIRECTORY) -> Dataset:
+    version = hash_file(path)
+    cache_path = os.path.join(cache_directory, f"{version}.v{CACHE_VERSION}.pickle") if cache_directory else None
+    if cache_path and os.path.exists(cache_path):
+        with open(cache_path, "rb") as file:
+            return pickle.load(file)
+    elements = {}
+    for raw in iter_json_elements(path):
+        element = normalize_element(raw)
+        elements[element["number"]] = element
+    dataset = Dataset(elements, version)
+    if cache_path:
+        os.makedirs(cache_directory, exist_ok=True)
+        temporary = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as file:
+            pickle.dump(dataset, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, cache_path)
+    return dataset
+
+
+def export_dataset(path: str, elements: dict = ELEMENTS_DATA):
+    with open(path, "w", encoding="utf-8") as file:
+        file.write('{"elements": [\n')
+        for index, number in enumerate(sorted(elements)):
+            file.write(("," if index else "") + json.dumps(elements[number], ensure_ascii=False) + "\n")
+        file.write("]}\n")
+
+
+_current = Dataset(ELEMENTS_DATA, "builtin")
+_swap_lock = threading.Lock()
+
+
+def get_dataset() -> Dataset:
+    return _current
+
+
+def swap_dataset(path: str, cache_directory: str | None = CACHE_DIRECTORY) -> Dataset:
+    # The new dataset is fully built before a single reference assignment publishes it,
+    # so readers holding the previous Dataset keep a consistent snapshot
+    global _current
+    with _swap_lock:
+        dataset = load_dataset(path, cache_directory)
+        # The species configuration tables are built per atomic number at import and are not swapped
+        if dataset.elements.keys() != ELEMENTS_DATA.keys():
+            raise ValueError(f"{path} must cover atomic numbers {min(ELEMENTS_DATA)} to {max(ELEMENTS_DATA)}.")
+        _current = dataset
+    return dataset
@@ -0,0 +1,43 @@
+from math import lgamma
+
+import numpy as np
+
+from slater import EFFECTIVE_N, EFFECTIVE_NUCLEAR_CHARGES
+from species import ELEMENT_ROWS, OCCUPANCY_MATRIX, SPECIES_INDEX
+
+
+RADIAL_GRID = np.linspace(0, 12, 2401)  # Bohr radii
+LOG_GAMMAS = np.array([lgamma(2 * n + 1) for n in EFFECTIVE_N])
+
+
+def get_slater_densities(effective_charges: np.ndarray, grid: np.ndarray = RADIAL_GRID) -> np.ndarray:
+    # Normalized r² |R|² of a Slater-type orbital r^(n*-1) e^(-ζr) with ζ = Z_eff / n*, one row per subshell
+    zeta = np.where(np.nan_to_num(effective_charges) > 0, effective_charges, np.nan) / EFFECTIVE_N
+    exponents = 2 * EFFECTIVE_N[..., None]
+    with np.errstate(divide="ignore"):
+        log_r = np.log(grid)
+    log_norm = (exponents + 1) * np.log(2 * zeta)[..., None] - LOG_GAMMAS[..., None]
+    log_density = log_norm + exponents * log_r - 2 * zeta[..., None] * grid
+    return np.nan_to_num(np.exp(log_density))
+
+
+def get_radial_densities(rows: np.ndarray, grid: np.ndarray = RADIAL_GRID) -> np.ndarray:
+    rows = np.atleast_1d(rows)
+    basis = get_slater_densities(EFFECTIVE_NUCLEAR_CHARGES[rows], grid)
+    return np.einsum("sk,skg->sg", OCCUPANCY_MATRIX[rows].astype(np.float64), basis)
+
+
+def get_radial_density(atomic_number: int, charge: int = 0, grid: np.ndarray = RADIAL_GRID) -> np.ndarray:
+    return get_radial_densities(np.array([SPECIES_INDEX[atomic_number, charge]]), grid)[0]
+
+
+def get_element_densities(grid: np.ndarray = RADIAL_GRID) -> np.ndarray:
+    return get_radial_densities(ELEMENT_ROWS, grid)
+
+
+def get_enclosing_radii(densities: np.ndarray, grid: np.ndarray = RADIAL_GRID, fraction: float = 0.9) -> np.ndarray:
+    densities = np.atleast_2d(densities)
+    steps = (densities[:, 1:] + densities[:, :-1]) / 2 * np.diff(grid)
+    cumulative = np.concatenate((np.zeros((len(densities), 1)), np.cumsum(steps, axis=1)), axis=1)
+    targets = fraction * cumulative[:, -1:]
+    return grid[np.argmax(cumulative >= targets, axis=1)]
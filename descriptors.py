@@ -0,0 +1,57 @@
+import numpy as np
+
+from electrons import SUBSHELL_CAPACITIES
+from periodictable import ELEMENTS_DATA
+from species import ELEMENT_ROWS, LAST_SUBSHELLS, OCCUPANCY_MATRIX, ORBITAL_L, ORBITAL_N, get_outer_occupancies
+
+
+BLOCK_LETTERS = np.array(list("spdf"))
+# Lanthanides and actinides are laid out in rows 9 and 10 below the main table
+F_BLOCK_ROWS = (9, 10)
+
+
+def build_descriptors():
+    atomic_numbers = np.array(sorted(ELEMENTS_DATA))
+    rows = ELEMENT_ROWS
+    occupancies = OCCUPANCY_MATRIX[rows].astype(np.int16)
+    x = np.array([ELEMENTS_DATA[atomic_number]["x"] for atomic_number in atomic_numbers])
+    y = np.array([ELEMENTS_DATA[atomic_number]["y"] for atomic_number in atomic_numbers])
+    f_block = np.isin(y, F_BLOCK_ROWS)
+
+    blocks = np.where(f_block, 3, ORBITAL_L[LAST_SUBSHELLS[rows]])
+    # The f-block rows fill the gap under group 3
+    groups = np.where(f_block, 3, x)
+
+    shells = np.zeros((len(atomic_numbers), int(ORBITAL_N.max())), dtype=np.uint8)
+    for column, n in enumerate(ORBITAL_N):
+        shells[:, n - 1] += occupancies[:, column].astype(np.uint8)
+
+    # Valence electrons sit outside the noble-gas core. Every f electron there is an (n-2)f electron, so
+    # lanthanides and actinides count 2 (3 for Lu and Lr); filled d subshells only count for the d block
+    outer = get_outer_occupancies(occupancies)
+    inner = (ORBITAL_L == 3) | ((ORBITAL_L == 2) & (outer == SUBSHELL_CAPACITIES) & (blocks[:, None] != 2))
+    valence = np.where(inner, 0, outer).sum(axis=1)
+
+    table = np.zeros(
+        max(ELEMENTS_DATA) + 1,
+        dtype=[("block", "U1"), ("group", np.uint8), ("valence", np.uint8), ("shells", np.uint8, shells.shape[1])],
+    )
+    table["block"][atomic_numbers] = BLOCK_LETTERS[blocks]
+    table["group"][atomic_numbers] = groups
+    table["valence"][atomic_numbers] = valence
+    table["shells"][atomic_numbers] = shells
+    table.flags.writeable = False
+    return table
+
+
+ELEMENT_DESCRIPTORS = build_descriptors()
+
+
+def get_element_descriptors(atomic_number: int) -> dict:
+    row = ELEMENT_DESCRIPTORS[atomic_number]
+    return {
+        "block": str(row["block"]),
+        "group": int(row["group"]),
+        "valence-electrons": int(row["valence"]),
+        "shells": tuple(int(count) for count in row["shells"] if count),
+    }
@@ -0,0 +1,49 @@
+from electrons import NOBLE_GASES, ORBITALS, SUBORBITAL_COUNTS, get_occupancy
+
+
+EMPTY_BOX, HALF_BOX, FULL_BOX = "[  ]", "[↑ ]", "[↑↓]"
+
+
+def render_subshell(orbital_count: int, electron_count: int) -> str:
+    up = min(electron_count, orbital_count)
+    down = electron_count - up
+    return FULL_BOX * down + HALF_BOX * (up - down) + EMPTY_BOX * (orbital_count - up)
+
+
+# Pre-rendered "3d [↑↓][↑ ]..." lines for every subshell and occupancy
+SUBSHELL_DIAGRAMS = [
+    [
+        f"{orbital[0]}{orbital[1]} " + render_subshell(SUBORBITAL_COUNTS[orbital[1]], electron_count)
+        for electron_count in range(SUBORBITAL_COUNTS[orbital[1]] * 2 + 1)
+    ]
+    for orbital in ORBITALS
+]
+
+
+def get_orbital_diagram(occupancy, separator: str = "\n") -> str:
+    return separator.join(
+        SUBSHELL_DIAGRAMS[index][electrons] for index, electrons in enumerate(occupancy) if electrons
+    )
+
+
+def get_electron_diagram(electron_count: int, separator: str = "\n") -> str:
+    return get_orbital_diagram(get_occupancy(electron_count), separator)
+
+
+def get_valence_diagram(occupancy, separator: str = "\n") -> str:
+    # Only the subshells outside the noble-gas core, matching the short configuration
+    electron_count = sum(occupancy)
+    for core_electrons, _, skip_orbitals in reversed(NOBLE_GASES):
+        if electron_count > core_electrons:
+            return get_orbital_diagram((0,) * skip_orbitals + tuple(occupancy[skip_orbitals:]), separator)
+    return get_orbital_diagram(occupancy, separator)
+
+
+def iter_quantum_numbers(occupancy):
+    for index, electrons in enumerate(occupancy):
+        n, letter = ORBITALS[index]
+        l = "spdf".index(letter)
+        orbital_count = SUBORBITAL_COUNTS[letter]
+        for electron in range(electrons):
+            ms = 0.5 if electron < orbital_count else -0.5
+            yield n, l, l - electron % orbital_count, ms
@@ -0,0 +1,186 @@
+from typing import Literal
+
+import re
+import unicodedata
+from dataset import get_dataset
+
+
+ORBITALS = [
+    (1, "s"), (2, "s"), (2, "p"),
+    (3, "s"), (3, "p"), (4, "s"), 
+    (3, "d"), (4, "p"), (5, "s"),
+    (4, "d"), (5, "p"), (6, "s"),
+    (4, "f"), (5, "d"), (6, "p"),
+    (7, "s"), (5, "f"), (6, "d"),
+    (7, "p"),
+]
+SUBORBITAL_COUNTS = {"s": 1, "p": 3, "d": 5, "f": 7}
+SUBSHELL_CAPACITIES = [SUBORBITAL_COUNTS[orbital[1]] * 2 for orbital in ORBITALS]
+MAX_ELECTRONS = sum(SUBSHELL_CAPACITIES)
+NOBLE_GASES = [
+    (2, "₂He", 1),
+    (10, "₁₀Ne", 3),
+    (18, "₁₈Ar", 5),
+    (36, "₃₆Kr", 8),
+    (54, "₅₄Xe", 11),
+    (86, "₈₆Rn", 15),
+]
+# Cations lose electrons from the period a subshell fills in (n for s and p, n + 1 for d, n + 2 for f),
+# latest period first, and within a period from p, then s, then d, then f
+PERIOD_OFFSETS = {"s": 0, "p": 0, "d": 1, "f": 2}
+REMOVAL_ORDER = sorted(
+    range(len(ORBITALS)),
+    key=lambda index: (ORBITALS[index][0] + PERIOD_OFFSETS[ORBITALS[index][1]], "fdsp".index(ORBITALS[index][1])),
+    reverse=True,
+)
+# d subshells, highest n first, so the first occupied one is a species' outermost d subshell
+D_SUBSHELLS = sorted(
+    (index for index, orbital in enumerate(ORBITALS) if orbital[1] == "d"), key=lambda index: -ORBITALS[index][0]
+)
+RELATIVISTIC_ATOMIC_NUMBER = 87
+NOBLE_GAS_CORES = {"He": 2, "Ne": 10, "Ar": 18, "Kr": 36, "Xe": 54, "Rn": 86}
+
+CONFIGURATION_TOKEN = re.compile(
+    r"\[\s*[⁰¹²³⁴⁵⁶⁷⁸⁹₀₁₂₃₄₅₆₇₈₉0-9]*\s*([A-Za-z]{2})\s*\]"
+    r"|(\d+)([spdfSPDF])(?:\^?(\d+)|([⁰¹²³⁴⁵⁶⁷⁸⁹]+))?"
+)
+CONFIGURATION_SEPARATORS = re.compile(r"[\s,.;·]*")
+FROM_SUPER = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹", "0123456789")
+SPECIES_INPUT = re.compile(r"^\s*(\d+|[^\W\d_]+)\s*\^?(\d*)([+-]?)\s*$")
+CONFIGURATION_INPUT = re.compile(r"^\s*(\[|\d+[spdfSPDF])")
+
+
+class PhysicsError(ValueError):
+    pass
+
+
+def convert_to_script(x: str | int, mode: Literal["super", "sub"] = "super") -> str:
+    SUPER = str.maketrans("0123456789+-()", "⁰¹²³⁴⁵⁶⁷⁸⁹⁺⁻⁽⁾")
+    SUB = str.maketrans("0123456789+-()", "₀₁₂₃₄₅₆₇₈₉₊₋₍₎")
+    x = str(x)
+    if mode == "super":
+        return x.translate(SUPER)
+    else:
+        return x.translate(SUB)
+
+
+def get_electron_configuration(electron_count: int, skip_orbitals: int = 0) -> str:
+    configuration = []
+    for orbital in ORBITALS[skip_orbitals:]:
+        configuration.append(
+            f"{orbital[0]}{orbital[1]}{convert_to_script(min(electron_count, SUBORBITAL_COUNTS[orbital[1]] * 2))}"
+        )
+        electron_count -= min(electron_count, SUBORBITAL_COUNTS[orbital[1]] * 2)
+        if electron_count <= 0:
+            break
+    return " ".join(configuration)
+
+
+def get_short_electron_configuration(electron_count: int):
+    for noble_gas in reversed(NOBLE_GASES):
+        if electron_count > noble_gas[0]:
+            return f"[{noble_gas[1]}] " + get_electron_configuration(
+                electron_count - noble_gas[0], skip_orbitals=noble_gas[2]
+            )
+    return get_electron_configuration(electron_count)
+
+
+def get_occupancy(electron_count: int) -> tuple[int, ...]:
+    occupancy = []
+    for capacity in SUBSHELL_CAPACITIES:
+        occupancy.append(min(max(electron_count, 0), capacity))
+        electron_count -= occupancy[-1]
+    return tuple(occupancy)
+
+
+def format_occupancy(occupancy) -> str:
+    return " ".join(
+        f"{orbital[0]}{orbital[1]}{convert_to_script(electrons)}"
+        for orbital, electrons in zip(ORBITALS, occupancy)
+        if electrons
+    )
+
+
+def format_short_occupancy(occupancy) -> str:
+    electron_count = sum(occupancy)
+    for core_electrons, core_label, skip_orbitals in reversed(NOBLE_GASES):
+        if electron_count > core_electrons:
+            return f"[{core_label}] " + format_occupancy((0,) * skip_orbitals + tuple(occupancy[skip_orbitals:]))
+    return format_occupancy(occupancy)
+
+
+def get_ion_occupancy(atomic_number: int, charge: int = 0) -> tuple[int, ...]:
+    if charge <= 0:
+        return get_occupancy(atomic_number - charge)
+    occupancy = list(get_occupancy(atomic_number))
+    for index in REMOVAL_ORDER:
+        removed = min(charge, occupancy[index])
+        occupancy[index] -= removed
+        charge -= removed
+    return tuple(occupancy)
+
+
+def parse_electron_configuration(configuration: str) -> tuple[int, ...]:
+    occupancy = [0] * len(ORBITALS)
+    seen = set()
+    position = 0
+    configuration = configuration.strip()
+    while position < len(configuration):
+        position = CONFIGURATION_SEPARATORS.match(configuration, position).end()
+        if position == len(configuration):
+            break
+        match = CONFIGURATION_TOKEN.match(configuration, position)
+        if match is None:
+            raise PhysicsError(f"Unrecognized configuration term: {configuration[position:].split()[0]}")
+        position = match.end()
+        if match.group(1):
+            core = match.group(1)[0].upper() + match.group(1)[1].lower()
+            if core not in NOBLE_GAS_CORES:
+                raise PhysicsError(f"[{core}] is not a noble gas core.")
+            for index, electrons in enumerate(get_occupancy(NOBLE_GAS_CORES[core])):
+                if electrons:
+                    if index in seen:
+                        raise PhysicsError(f"[{core}] overlaps subshells given elsewhere.")
+                    seen.add(index)
+                    occupancy[index] = electrons
+            continue
+        orbital = (int(match.group(2)), match.group(3).lower())
+        if orbital not in ORBITALS:
+            raise PhysicsError(f"Subshell {orbital[0]}{orbital[1]} is not supported.")
+        index = ORBITALS.index(orbital)
+        if index in seen:
+            raise PhysicsError(f"Subshell {orbital[0]}{orbital[1]} is given more than once.")
+        seen.add(index)
+        electrons = match.group(4) or (match.group(5) or "1").translate(FROM_SUPER)
+        occupancy[index] = int(electrons)
+        if occupancy[index] > SUBSHELL_CAPACITIES[index]:
+            raise PhysicsError(
+                f"Subshell {orbital[0]}{orbital[1]} holds at most {SUBSHELL_CAPACITIES[index]} electrons."
+            )
+    if not seen:
+        raise PhysicsError("Configuration is empty.")
+    return tuple(occupancy)
+
+
+def parse_species(text: str) -> tuple[int, int]:
+    match = SPECIES_INPUT.match(text)
+    if match is None or (match.group(2) and not match.group(3)):
+        raise PhysicsError(f"Unrecognized species: {text}")
+    name, magnitude, sign = match.groups()
+    dataset = get_dataset()
+    if name.isdigit():
+        atomic_number = int(name)
+    elif len(name) <= 2 and name[0].upper() + name[1:].lower() in dataset.symbol_to_number:
+        atomic_number = dataset.symbol_to_number[name[0].upper() + name[1:].lower()]
+    else:
+        atomic_number = dataset.name_to_number.get(remove_diacritics(name.lower()))
+    if atomic_number not in dataset.elements:
+        raise PhysicsError(f"Element not found in the periodic table: {name}")
+    charge = int(magnitude or 1) * (1 if sign == "+" else -1) if sign else 0
+    return atomic_number, charge
+
+
+def remove_diacritics(text: str) -> str:
+    normalized_text = unicodedata.normalize('NFD', text)
+    without_diacritics = normalized_text.encode('ascii', 'ignore').decode('utf-8')
+    return without_diacritics
@@ -0,0 +1,47 @@
+from electrons import ORBITALS, SUBSHELL_CAPACITIES, get_ion_occupancy
+
+
+def iter_excited_configurations(
+    occupancy,
+    max_promotions: int = 1,
+    max_n: int | None = None,
+    max_order: int = len(ORBITALS),
+):
+    occupancy = tuple(occupancy)
+    # Room each subshell offers to promoted electrons after pruning by n and by position in ORBITALS
+    room = [
+        capacity - electrons if index < max_order and (max_n is None or ORBITALS[index][0] <= max_n) else 0
+        for index, (capacity, electrons) in enumerate(zip(SUBSHELL_CAPACITIES, occupancy))
+    ]
+    room_after = [sum(room[index + 1:]) for index in range(len(room))]
+
+    # Each configuration is produced once: a subshell either loses or gains electrons, and every gained
+    # electron must come from a subshell earlier in ORBITALS, which the running "pending" count enforces
+    def expand(index: int, configuration: list[int], pending: int, promoted: int):
+        if index == len(occupancy):
+            if pending == 0 and promoted:
+                yield tuple(configuration)
+            return
+        electrons = occupancy[index]
+        for added in range(min(room[index], pending), 0, -1):
+            if pending - added > room_after[index]:
+                break
+            configuration.append(electrons + added)
+            yield from expand(index + 1, configuration, pending - added, promoted)
+            configuration.pop()
+        if pending <= room_after[index]:
+            configuration.append(electrons)
+            yield from expand(index + 1, configuration, pending, promoted)
+            configuration.pop()
+        for removed in range(1, min(electrons, max_promotions - promoted) + 1):
+            if pending + removed > room_after[index]:
+                break
+            configuration.append(electrons - removed)
+            yield from expand(index + 1, configuration, pending + removed, promoted + removed)
+            configuration.pop()
+
+    yield from expand(0, [], 0, 0)
+
+
+def iter_species_excitations(atomic_number: int, charge: int = 0, **pruning):
+    yield from iter_excited_configurations(get_ion_occupancy(atomic_number, charge), **pruning)
@@ -0,0 +1,67 @@
+from itertools import islice
+
+import numpy as np
+
+from dataset import get_dataset
+from molarmass import build_compositions
+from periodictable import ELECTRONEGATIVITIES
+from species import ELEMENT_ROWS, OCCUPANCY_MATRIX, get_outer_counts_by_l
+
+
+NUMERIC_PROPERTIES = ["number", "atomic-mass", "period", "x", "density", "melt", "boil", "molar-heat"]
+PROPERTY_NAMES = NUMERIC_PROPERTIES + ["electronegativity", "valence-s", "valence-p", "valence-d", "valence-f"]
+STATISTICS = ["mean", "min", "max", "range"]
+FEATURE_NAMES = [f"{statistic}-{name}" for statistic in STATISTICS for name in PROPERTY_NAMES]
+
+
+def build_property_table(dataset) -> np.ndarray:
+    table = np.full((max(dataset.elements) + 1, len(PROPERTY_NAMES)), np.nan)
+    for atomic_number, data in dataset.elements.items():
+        values = [data.get(name) for name in NUMERIC_PROPERTIES]
+        values.append(data.get("electronegativity-pauling", ELECTRONEGATIVITIES[atomic_number]))
+        table[atomic_number, : len(values)] = [value if isinstance(value, (int, float)) else np.nan for value in values]
+    table[sorted(dataset.elements), -4:] = get_outer_counts_by_l(OCCUPANCY_MATRIX[ELEMENT_ROWS])
+    table.flags.writeable = False
+    return table
+
+
+def get_property_table() -> np.ndarray:
+    return get_dataset().derive("featurizer-properties", build_property_table)
+
+
+def featurize_compositions(offsets: np.ndarray, atoms: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    starts = offsets[:-1]
+    empty = starts == offsets[1:]
+    # A NaN sentinel row keeps reduceat's starts in range when trailing formulas have no atoms
+    values = np.vstack((get_property_table()[atoms], np.full(len(PROPERTY_NAMES), np.nan)))
+    present = ~np.isnan(values)
+    weights = np.where(present, np.concatenate((counts, [0.0]))[:, None], 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.add.reduceat(weights * np.nan_to_num(values), starts) / np.add.reduceat(weights, starts)
+    minimum = np.fmin.reduceat(values, starts)
+    maximum = np.fmax.reduceat(values, starts)
+    features = np.concatenate((mean, minimum, maximum, maximum - minimum), axis=1)
+    features[empty] = np.nan
+    return features
+
+
+def featurize(formulas) -> np.ndarray:
+    offsets, atoms, counts, _ = build_compositions(formulas)
+    return featurize_compositions(offsets, atoms, counts)
+
+
+def featurize_to_npy(formulas, path, count: int | None = None, chunk_size: int = 65536) -> np.ndarray:
+    # Writes straight into a memory-mapped .npy so the feature matrix never has to fit in RAM
+    if count is None:
+        formulas = list(formulas)
+        count = len(formulas)
+    output = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(count, len(FEATURE_NAMES)))
+    formulas = iter(formulas)
+    position = 0
+    while chunk := list(islice(formulas, min(chunk_size, count - position))):
+        output[position : position + len(chunk)] = featurize(chunk)
+        position += len(chunk)
+    output.flush()
+    if position < count:
+        raise ValueError(f"Expected {count} formulas, got {position}.")
+    return output
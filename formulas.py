@@ -0,0 +1,128 @@
+from collections import Counter
+from functools import lru_cache
+
+import re
+
+from dataset import get_dataset
+from descriptors import ELEMENT_DESCRIPTORS
+from electrons import FROM_SUPER, PhysicsError, convert_to_script, get_electron_configuration
+
+
+FORMULA_TOKEN = re.compile(
+    r"(?P<element>[A-Z][a-z]?)|(?P<count>\d+)|(?P<open>[(\[{])|(?P<close>[)\]}])|(?P<hydrate>[·•*.])|(?P<space>\s+)"
+)
+# Charge digits need a bracket, caret or space before them, so [Co(NH3)6]3+ is +3. A bare sign right after
+# a count, as in Fe2+ or NH4+, could be either a count or a charge and is rejected
+FORMULA_CHARGE = re.compile(r"(?:(?<=[)\]}])|\^|\s+)(\d*)([+-])$|([+-])$")
+AMBIGUOUS_CHARGE = re.compile(r"(?<=[A-Za-z])(\d+)[+-]$")
+SUPERSCRIPT_CHARGE = re.compile(r"([⁰¹²³⁴⁵⁶⁷⁸⁹]*)([⁺⁻])$")
+FROM_SUB = str.maketrans("₀₁₂₃₄₅₆₇₈₉", "0123456789")
+BRACKET_PAIRS = {"(": ")", "[": "]", "{": "}"}
+
+
+def split_charge(formula: str) -> tuple[str, int]:
+    formula = formula.strip().translate(FROM_SUB)
+    match = SUPERSCRIPT_CHARGE.search(formula)
+    if match is not None:
+        magnitude, sign = int(match.group(1).translate(FROM_SUPER) or 1), match.group(2)
+    else:
+        ambiguous = AMBIGUOUS_CHARGE.search(formula)
+        if ambiguous is not None:
+            body, digits, sign = formula[: ambiguous.start()], ambiguous.group(1), formula[-1]
+            superscript = convert_to_script(f"{digits}{sign}")
+            raise PhysicsError(
+                f"Ambiguous charge in {formula}: write {body}^{digits}{sign}, {body} {digits}{sign} or "
+                f"{body}{superscript} for a charge of {digits}{sign}, or {body}{digits}^{sign} for a count."
+            )
+        match = FORMULA_CHARGE.search(formula)
+        if match is None:
+            return formula, 0
+        magnitude, sign = int(match.group(1) or 1), match.group(2) or match.group(3)
+    return formula[: match.start()].rstrip(), magnitude if sign in "+⁺" else -magnitude
+
+
+def parse_formula(formula: str) -> tuple[tuple[tuple[int, int], ...], int]:
+    return parse_dataset_formula(formula, get_dataset())
+
+
+# Keyed on the dataset too, so a swap that renames a symbol cannot serve stale parses
+@lru_cache(maxsize=65536)
+def parse_dataset_formula(formula: str, dataset) -> tuple[tuple[tuple[int, int], ...], int]:
+    symbol_to_number = dataset.symbol_to_number
+    body, charge = split_charge(formula)
+    total = Counter()
+    stack = [(Counter(), None)]
+    multiplier = 1
+    last = None
+    position = 0
+    for match in FORMULA_TOKEN.finditer(body):
+        if match.start() != position:
+            raise PhysicsError(f"Unexpected character in formula: {body[position]}")
+        position = match.end()
+        kind = match.lastgroup
+        if kind == "element":
+            if match.group() not in symbol_to_number:
+                raise PhysicsError(f"Unknown element symbol: {match.group()}")
+            last = Counter({symbol_to_number[match.group()]: 1})
+            stack[-1][0].update(last)
+        elif kind == "count":
+            if int(match.group()) == 0:
+                raise PhysicsError("Formula counts must be at least 1.")
+            if last is None:
+                # A leading number is the coefficient of the whole unit, as in 2H2O
+                if len(stack) > 1 or stack[-1][0]:
+                    raise PhysicsError(f"Misplaced number in formula: {match.group()}")
+                multiplier *= int(match.group())
+                continue
+            for atomic_number, count in last.items():
+                stack[-1][0][atomic_number] += count * (int(match.group()) - 1)
+        elif kind == "open":
+            stack.append((Counter(), match.group()))
+        elif kind == "close":
+            group, opened = stack.pop() if len(stack) > 1 else (None, None)
+            if opened is None or BRACKET_PAIRS[opened] != match.group():
+                raise PhysicsError(f"Unbalanced bracket in formula: {match.group()}")
+            stack[-1][0].update(group)
+            last = group
+            continue
+        elif kind == "hydrate":
+            if len(stack) > 1:
+                raise PhysicsError("Hydrate separator inside brackets.")
+            for atomic_number, count in stack[0][0].items():
+                total[atomic_number] += count * multiplier
+            stack = [(Counter(), None)]
+            multiplier = 1
+        if kind != "element":
+            last = None
+    if position != len(body):
+        raise PhysicsError(f"Unexpected character in formula: {body[position]}")
+    if len(stack) > 1:
+        raise PhysicsError("Unclosed bracket in formula.")
+    for atomic_number, count in stack[0][0].items():
+        total[atomic_number] += count * multiplier
+    if not total:
+        raise PhysicsError("Formula is empty.")
+    return tuple(sorted(total.items())), charge
+
+
+@lru_cache(maxsize=None)
+def get_atom_configuration(atomic_number: int) -> str:
+    return get_electron_configuration(atomic_number)
+
+
+def describe_formula(formula: str) -> dict:
+    composition, charge = parse_formula(formula)
+    elements = get_dataset().elements
+    return {
+        "composition": {elements[atomic_number]["symbol"]: count for atomic_number, count in composition},
+        "charge": charge,
+        "configurations": {
+            elements[atomic_number]["symbol"]: get_atom_configuration(atomic_number)
+            for atomic_number, _ in composition
+        },
+        "total-electrons": sum(atomic_number * count for atomic_number, count in composition) - charge,
+        "valence-electrons": sum(
+            int(ELEMENT_DESCRIPTORS["valence"][atomic_number]) * count for atomic_number, count in composition
+        )
+        - charge,
+    }
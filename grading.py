@@ -0,0 +1,89 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+
+import csv
+import sys
+
+from electrons import (
+    MAX_ELECTRONS,
+    ORBITALS,
+    PhysicsError,
+    get_ion_occupancy,
+    get_occupancy,
+    parse_electron_configuration,
+    parse_species,
+)
+
+
+INPUT_HEADER = ["student", "species", "submission"]
+
+
+@lru_cache(maxsize=None)
+def get_answers(atomic_number: int, charge: int) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    # The removal-order ion configuration is the answer; the plain Aufbau form for the electron count is kept
+    # so the classic mistake of removing electrons from the last subshell filled can be named in the feedback
+    if not 0 < atomic_number - charge <= MAX_ELECTRONS:
+        raise PhysicsError("Species has no valid electron count.")
+    return get_ion_occupancy(atomic_number, charge), get_occupancy(atomic_number - charge)
+
+
+def describe_differences(expected: tuple[int, ...], submitted: tuple[int, ...]) -> str:
+    return "; ".join(
+        f"{orbital[0]}{orbital[1]}: expected {want}, got {got}"
+        for orbital, want, got in zip(ORBITALS, expected, submitted)
+        if want != got
+    )
+
+
+@lru_cache(maxsize=65536)
+def grade_submission(species: str, submission: str) -> tuple[bool, str]:
+    try:
+        expected, aufbau = get_answers(*parse_species(species))
+        submitted = parse_electron_configuration(submission)
+    except PhysicsError as e:
+        return False, str(e)
+    if submitted == expected:
+        return True, ""
+    feedback = describe_differences(expected, submitted)
+    if submitted == aufbau:
+        feedback = f"cations lose electrons from the highest shell first, not the last subshell filled; {feedback}"
+    elif sum(submitted) != sum(expected):
+        feedback = f"expected {sum(expected)} electrons, got {sum(submitted)}; {feedback}"
+    return False, feedback
+
+
+def grade_rows(rows: list[list[str]]) -> list[list[str]]:
+    graded = []
+    for student, species, submission in rows:
+        correct, feedback = grade_submission(species, submission)
+        graded.append([student, species, submission, "yes" if correct else "no", feedback])
+    return graded
+
+
+def iter_chunks(rows, chunk_size: int):
+    rows = iter(rows)
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
+
+
+def iter_submissions(reader):
+    for index, row in enumerate(reader):
+        # Only a first row matching the header is skipped, so a student named "Student" is still graded
+        if not row or (index == 0 and [cell.strip().lower() for cell in row[:3]] == INPUT_HEADER):
+            continue
+        yield [*row[:3], *[""] * (3 - len(row))]
+
+
+def grade_csv(source, output, workers: int | None = None, chunk_size: int = 5000):
+    writer = csv.writer(output)
+    writer.writerow(INPUT_HEADER + ["correct", "feedback"])
+    rows = iter_submissions(csv.reader(source))
+    with ProcessPoolExecutor(workers) as executor:
+        for graded in executor.map(grade_rows, iter_chunks(rows, chunk_size)):
+            writer.writerows(graded)
+
+
+if __name__ == "__main__":
+    with open(sys.argv[1], newline="", encoding="utf-8") as source, open(sys.argv[2], "w", newline="", encoding="utf-8") as output:
+        grade_csv(source, output, int(sys.argv[3]) if len(sys.argv) > 3 else None)
@@ -0,0 +1,86 @@
+import sys
+
+import numpy as np
+
+from dataset import iter_json_elements
+from electrons import ORBITALS, PhysicsError, parse_electron_configuration
+from periodictable import ELEMENTS_DATA
+from species import OCCUPANCY_MATRIX, ORBITAL_N, SPECIES_INDEX
+
+
+MAX_ATOMIC_NUMBER = max(ELEMENTS_DATA)
+MAX_SHELLS = int(ORBITAL_N.max())
+FLOAT_FIELDS = {"electronegativity_pauling": "electronegativity-pauling", "electron_affinity": "electron-affinity"}
+
+
+def ingest_bowserinator(path: str) -> dict:
+    rows = MAX_ATOMIC_NUMBER + 1
+    columns = {name: np.full(rows, np.nan) for name in FLOAT_FIELDS.values()}
+    columns["shells"] = np.zeros((rows, MAX_SHELLS), dtype=np.uint8)
+    # Rows that failed to parse keep -1 so the validation sweep can tell them apart from empty configurations
+    columns["reference-occupancies"] = np.full((rows, len(ORBITALS)), -1, dtype=np.int16)
+    ionization_energies = [[] for _ in range(rows)]
+    for element in iter_json_elements(path):
+        number = element["number"]
+        if not 0 < number < rows:
+            continue
+        for field, column in FLOAT_FIELDS.items():
+            if isinstance(element.get(field), (int, float)):
+                columns[column][number] = element[field]
+        shells = (element.get("shells") or [])[:MAX_SHELLS]
+        columns["shells"][number, : len(shells)] = shells
+        energies = element.get("ionization_energies") or []
+        # Gaps stay as NaN so every later energy keeps its ionization order
+        ionization_energies[number] = [np.nan if energy is None else energy for energy in energies]
+        # Upstream marks some superheavy entries with notes such as "(predicted)"
+        configuration = (element.get("electron_configuration") or "").split("(")[0]
+        try:
+            columns["reference-occupancies"][number] = parse_electron_configuration(configuration)
+        except PhysicsError:
+            pass
+    # Variable-length ionization energies as offsets into one flat array: Z owns values[offsets[Z]:offsets[Z + 1]]
+    counts = [len(energies) for energies in ionization_energies]
+    columns["ionization-energy-offsets"] = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+    columns["ionization-energies"] = np.fromiter(
+        (energy for energies in ionization_energies for energy in energies),
+        dtype=np.float64,
+        count=int(columns["ionization-energy-offsets"][-1]),
+    )
+    return columns
+
+
+def get_ionization_energies(columns: dict, atomic_number: int) -> np.ndarray:
+    offsets = columns["ionization-energy-offsets"]
+    return columns["ionization-energies"][offsets[atomic_number] : offsets[atomic_number + 1]]
+
+
+def validate_configurations(columns: dict) -> dict:
+    numbers = np.arange(1, MAX_ATOMIC_NUMBER + 1)
+    computed = OCCUPANCY_MATRIX[[SPECIES_INDEX[number, 0] for number in numbers]].astype(np.int16)
+    reference = columns["reference-occupancies"][numbers]
+    parsed = (reference >= 0).all(axis=1)
+    differences = np.where(parsed[:, None], reference - computed, 0)
+    mismatched = parsed & (differences != 0).any(axis=1)
+
+    computed_shells = np.zeros((len(numbers), MAX_SHELLS), dtype=np.int16)
+    np.add.at(computed_shells.T, ORBITAL_N - 1, computed.T)
+    reference_shells = columns["shells"][numbers].astype(np.int16)
+    has_shells = reference_shells.any(axis=1)
+    shell_mismatched = has_shells & (reference_shells != computed_shells).any(axis=1)
+    return {
+        "unparsed": numbers[~parsed].tolist(),
+        "mismatched": numbers[mismatched].tolist(),
+        "differences": differences,
+        "shell-mismatched": numbers[shell_mismatched].tolist(),
+    }
+
+
+if __name__ == "__main__":
+    report = validate_configurations(ingest_bowserinator(sys.argv[1]))
+    for atomic_number in report["mismatched"]:
+        changes = report["differences"][atomic_number - 1]
+        print(atomic_number, ", ".join(
+            f"{ORBITALS[index][0]}{ORBITALS[index][1]} {changes[index]:+d}" for index in np.flatnonzero(changes)
+        ))
+    print("unparsed:", report["unparsed"])
+    print("shell mismatches:", report["shell-mismatched"])
@@ -0,0 +1,26 @@
+import numpy as np
+
+from electrons import SUBSHELL_CAPACITIES
+from species import ION_OCCUPANCY_MATRIX, SPECIES_INDEX
+
+
+def get_unpaired_electrons(occupancies: np.ndarray) -> np.ndarray:
+    # Hund's rule: a subshell keeps one unpaired electron per singly occupied orbital
+    occupancies = np.asarray(occupancies, dtype=np.int16)
+    return np.minimum(occupancies, np.array(SUBSHELL_CAPACITIES) - occupancies).sum(axis=1)
+
+
+def get_spin_only_moments(unpaired: np.ndarray) -> np.ndarray:
+    return np.sqrt(unpaired * (unpaired + 2.0))
+
+
+UNPAIRED_ELECTRONS = get_unpaired_electrons(ION_OCCUPANCY_MATRIX)
+PARAMAGNETIC = UNPAIRED_ELECTRONS > 0
+MAGNETIC_MOMENTS = get_spin_only_moments(UNPAIRED_ELECTRONS)  # Bohr magnetons
+for column in (UNPAIRED_ELECTRONS, PARAMAGNETIC, MAGNETIC_MOMENTS):
+    column.flags.writeable = False
+
+
+def get_magnetic_properties(atomic_number: int, charge: int = 0) -> tuple[int, bool, float]:
+    index = SPECIES_INDEX[atomic_number, charge]
+    return int(UNPAIRED_ELECTRONS[index]), bool(PARAMAGNETIC[index]), float(MAGNETIC_MOMENTS[index])
@@ -0,0 +1,54 @@
+from itertools import islice
+
+import csv
+import sys
+
+import numpy as np
+
+from dataset import get_dataset
+from electrons import PhysicsError
+from formulas import parse_formula
+
+
+def build_compositions(formulas) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[str | None]]:
+    # Compressed sparse rows: formula i owns atoms[offsets[i]:offsets[i + 1]] with matching counts
+    offsets, atoms, counts, errors = [0], [], [], []
+    for formula in formulas:
+        try:
+            composition, _ = parse_formula(formula)
+        except PhysicsError as e:
+            composition = ()
+            errors.append(str(e))
+        else:
+            errors.append(None)
+        for atomic_number, count in composition:
+            atoms.append(atomic_number)
+            counts.append(count)
+        offsets.append(len(atoms))
+    return np.array(offsets), np.array(atoms, dtype=np.intp), np.array(counts, dtype=np.float64), errors
+
+
+def get_molar_masses(offsets: np.ndarray, atoms: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    weighted = np.concatenate((counts * get_dataset().atomic_masses[atoms], [0.0]))
+    masses = np.add.reduceat(weighted, offsets[:-1])
+    masses[offsets[:-1] == offsets[1:]] = np.nan
+    return masses
+
+
+def iter_molar_masses(formulas, chunk_size: int = 65536):
+    formulas = iter(formulas)
+    while chunk := [formula.strip() for formula in islice(formulas, chunk_size)]:
+        offsets, atoms, counts, errors = build_compositions(chunk)
+        yield from zip(chunk, get_molar_masses(offsets, atoms, counts).tolist(), errors)
+
+
+def write_molar_masses_csv(formulas, output, chunk_size: int = 65536):
+    writer = csv.writer(output)
+    writer.writerow(["formula", "molar-mass", "error"])
+    for formula, mass, error in iter_molar_masses(formulas, chunk_size):
+        writer.writerow([formula, "" if error else f"{mass:.4f}", error or ""])
+
+
+if __name__ == "__main__":
+    with open(sys.argv[1], encoding="utf-8") as formulas, open(sys.argv[2], "w", newline="", encoding="utf-8") as output:
+        write_molar_masses_csv((line for line in formulas if line.strip()), output)
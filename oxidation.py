@@ -0,0 +1,149 @@
+from functools import lru_cache
+
+from dataset import get_dataset
+from electrons import D_SUBSHELLS, PhysicsError, format_occupancy, get_ion_occupancy
+from formulas import parse_formula
+from periodictable import COMMON_OXIDATION_STATES, ELECTRONEGATIVITIES, ELEMENTS_DATA, Category
+
+
+METAL_CATEGORIES = {
+    Category.ALKALI_METAL,
+    Category.ALKALINE_EARTH_METAL,
+    Category.TRANSITION_METAL,
+    Category.LANTHANIDE,
+    Category.ACTINIDE,
+    Category.POST_TRANSITION_METAL,
+}
+# From the built-in table, as are the states and electronegativities, so cached assignments survive a dataset swap
+METALS = frozenset(number for number, data in ELEMENTS_DATA.items() if data["category"] in METAL_CATEGORIES)
+# Carbon chains routinely have a fractional average state, as C in C3H8 at -8/3
+AVERAGED_ELEMENTS = {6}
+# Metals are also allowed 0, for carbonyls such as Ni(CO)4 and for alloys, ranked as a rare state
+METAL_ZERO_RANK = 4
+
+
+def get_ranked_states(atomic_number: int) -> tuple[tuple[int, int], ...]:
+    states = COMMON_OXIDATION_STATES[atomic_number]
+    ranked = tuple((state, rank) for rank, state in enumerate(states))
+    if atomic_number in METALS and 0 not in states:
+        ranked += ((0, max(METAL_ZERO_RANK, len(states))),)
+    return ranked
+
+
+@lru_cache(maxsize=None)
+def get_state_options(
+    count: int, states: tuple[tuple[int, int], ...], allow_negative: bool = True, averaged: bool = False
+) -> list:
+    # An element takes one state, or splits its atoms over two states. A split across opposite signs, as for N
+    # in NH4NO3, is ranked on how common its states are; a same-sign split (mixed valence, as in Fe3O4) is only
+    # used when no assignment without one balances. An averaged element instead splits only over two adjacent
+    # states, without the mixed-valence penalty. Sorted best first so the search can stop early
+    splits = [((state, count),) for state, _ in states]
+    ranks = [(0, rank) for _, rank in states]
+    for position, (first, first_rank) in enumerate(states):
+        for second, second_rank in states[position + 1:]:
+            if averaged and abs(first - second) != 1:
+                continue
+            for first_count in range(1, count):
+                splits.append(((first, first_count), (second, count - first_count)))
+                ranks.append((int(not averaged and first * second >= 0), first_rank + second_rank))
+    options = []
+    for (mixed, rank), split in zip(ranks, splits):
+        if allow_negative or all(state >= 0 for state, _ in split):
+            total = sum(state * state_count for state, state_count in split)
+            options.append((mixed, rank, split, total, any(state > 0 for state, _ in split)))
+    return sorted(options)
+
+
+@lru_cache(maxsize=65536)
+def assign_oxidation_states(composition: tuple[tuple[int, int], ...], charge: int = 0):
+    if len(composition) == 1:
+        (atomic_number, count), = composition
+        low, extra = divmod(charge, count)
+        return ((atomic_number, ((low, count - extra), (low + 1, extra)) if extra else ((low, count),)),)
+
+    # Most electronegative first; elements without a value count as electropositive
+    ordered = sorted(composition, key=lambda entry: ELECTRONEGATIVITIES[entry[0]] or 0.0, reverse=True)
+    # An element split across opposite signs with nothing else to balance it, as N in NaN3, is the last resort
+    assignment = search_oxidation_states(ordered, charge) or search_oxidation_states(ordered, charge, polar=False)
+    if assignment is None:
+        raise PhysicsError("No charge-balanced oxidation states found.")
+    return tuple(sorted(assignment))
+
+
+def is_polar(assignment: list, electronegativities: list[float]) -> bool:
+    # Every negative element needs a less electronegative element that is positive, and the reverse, so that
+    # splits such as N -3/+5 in NH4NO3 are allowed but H -1/+1 in C2H6 is not
+    signs = [{state > 0 for state, _ in option if state} for _, option in assignment]
+    for index, element_signs in enumerate(signs):
+        for positive in element_signs:
+            if not any(
+                (not positive) in other_signs
+                and (electronegativities[other] > electronegativities[index]) == positive
+                and electronegativities[other] != electronegativities[index]
+                for other, other_signs in enumerate(signs)
+            ):
+                return False
+    return True
+
+
+def search_oxidation_states(ordered: list[tuple[int, int]], charge: int, polar: bool = True):
+    allowed = [get_ranked_states(atomic_number) for atomic_number, _ in ordered]
+    averaged = [atomic_number in AVERAGED_ELEMENTS for atomic_number, _ in ordered]
+    electronegativities = [ELECTRONEGATIVITIES[atomic_number] or 0.0 for atomic_number, _ in ordered]
+    # Range of charge still reachable by the elements from position i on, for pruning
+    reachable = [(0, 0)] * (len(ordered) + 1)
+    for index in range(len(ordered) - 1, -1, -1):
+        count = ordered[index][1]
+        low, high = reachable[index + 1]
+        states = [state for state, _ in allowed[index]]
+        reachable[index] = (low + count * min(states), high + count * max(states))
+
+    best = [None, None]
+
+    def search(index: int, remaining: int, assignment: list, score: tuple[int, int], positive_above: float):
+        if index == len(ordered):
+            if remaining == 0 and (not polar or is_polar(assignment, electronegativities)):
+                best[:] = list(assignment), score
+            return
+        low, high = reachable[index]
+        if not low <= remaining <= high:
+            return
+        atomic_number, count = ordered[index]
+        # An element may only be negative if no more electronegative element is positive
+        allow_negative = positive_above <= electronegativities[index]
+        for mixed, rank, option, total, positive in get_state_options(count, allowed[index], allow_negative, averaged[index]):
+            option_score = (score[0] + mixed, score[1] + rank)
+            if best[1] is not None and option_score >= best[1]:
+                break
+            assignment.append((atomic_number, option))
+            search(
+                index + 1,
+                remaining - total,
+                assignment,
+                option_score,
+                max(positive_above, electronegativities[index]) if positive else positive_above,
+            )
+            assignment.pop()
+
+    search(0, charge, [], (0, 0), float("-inf"))
+    return best[0]
+
+
+def describe_oxidation_states(formula: str) -> list[dict]:
+    composition, charge = parse_formula(formula)
+    elements = get_dataset().elements
+    atoms = []
+    for atomic_number, option in assign_oxidation_states(composition, charge):
+        for state, count in option:
+            if not count:
+                continue
+            occupancy = get_ion_occupancy(atomic_number, state)
+            atoms.append({
+                "symbol": elements[atomic_number]["symbol"],
+                "count": count,
+                "oxidation-state": state,
+                "configuration": format_occupancy(occupancy),
+                "d-electrons": next((occupancy[index] for index in D_SUBSHELLS if occupancy[index]), 0),
+            })
+    return atoms
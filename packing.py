@@ -0,0 +1,89 @@
+import numpy as np
+
+from electrons import ORBITALS, SUBSHELL_CAPACITIES, PhysicsError
+
+
+BITS_PER_SUBSHELL = 4
+SUBSHELL_MASK = (1 << BITS_PER_SUBSHELL) - 1
+PACKED_BITS = BITS_PER_SUBSHELL * len(ORBITALS)
+# Subshells packed into the low uint64 word; the rest go into the high word
+LOW_WORD_SUBSHELLS = 64 // BITS_PER_SUBSHELL
+NIBBLE_PAIRS = int("0F" * ((PACKED_BITS + 7) // 8), 16)
+BYTE_SUMS = int("01" * ((PACKED_BITS + 7) // 8), 16)
+SHIFTS = np.arange(len(ORBITALS), dtype=np.uint64) * np.uint64(BITS_PER_SUBSHELL)
+SUBSHELL_CAPACITY_ARRAY = np.array(SUBSHELL_CAPACITIES)
+
+
+def encode_occupancy(occupancy) -> int:
+    key = 0
+    for index, electrons in enumerate(occupancy):
+        if not 0 <= electrons <= SUBSHELL_CAPACITIES[index]:
+            raise PhysicsError(f"Subshell {index} cannot hold {electrons} electrons.")
+        key |= electrons << (BITS_PER_SUBSHELL * index)
+    return key
+
+
+def decode_occupancy(key: int) -> tuple[int, ...]:
+    return tuple((key >> (BITS_PER_SUBSHELL * index)) & SUBSHELL_MASK for index in range(len(ORBITALS)))
+
+
+def packed_electron_count(key: int) -> int:
+    byte_sums = (key & NIBBLE_PAIRS) + ((key >> BITS_PER_SUBSHELL) & NIBBLE_PAIRS)
+    return ((byte_sums * BYTE_SUMS) >> (8 * (((PACKED_BITS + 7) // 8) - 1))) & 0xFF
+
+
+def changed_subshells(first: int, second: int) -> list[int]:
+    changed = []
+    difference = first ^ second
+    while difference:
+        index = ((difference & -difference).bit_length() - 1) // BITS_PER_SUBSHELL
+        changed.append(index)
+        difference &= ~(SUBSHELL_MASK << (BITS_PER_SUBSHELL * index))
+    return changed
+
+
+def occupancy_difference(first: int, second: int) -> dict[int, int]:
+    return {
+        index: ((second >> (BITS_PER_SUBSHELL * index)) & SUBSHELL_MASK)
+        - ((first >> (BITS_PER_SUBSHELL * index)) & SUBSHELL_MASK)
+        for index in changed_subshells(first, second)
+    }
+
+
+def pack_occupancies(occupancies: np.ndarray) -> np.ndarray:
+    occupancies = np.asarray(occupancies)
+    # One check per array: a value above 15 would spill into the next subshell's bits
+    invalid = (occupancies < 0) | (occupancies > SUBSHELL_CAPACITY_ARRAY)
+    if invalid.any():
+        row, index = np.argwhere(invalid)[0]
+        raise PhysicsError(f"Subshell {index} cannot hold {occupancies[row, index]} electrons.")
+    occupancies = occupancies.astype(np.uint64)
+    packed = np.zeros((len(occupancies), 2), dtype=np.uint64)
+    packed[:, 0] = np.bitwise_or.reduce(
+        occupancies[:, :LOW_WORD_SUBSHELLS] << SHIFTS[:LOW_WORD_SUBSHELLS], axis=1
+    )
+    packed[:, 1] = np.bitwise_or.reduce(
+        occupancies[:, LOW_WORD_SUBSHELLS:] << SHIFTS[: len(ORBITALS) - LOW_WORD_SUBSHELLS], axis=1
+    )
+    return packed
+
+
+def unpack_occupancies(packed: np.ndarray) -> np.ndarray:
+    packed = np.asarray(packed, dtype=np.uint64)
+    occupancies = np.empty((len(packed), len(ORBITALS)), dtype=np.uint8)
+    occupancies[:, :LOW_WORD_SUBSHELLS] = (
+        packed[:, :1] >> SHIFTS[:LOW_WORD_SUBSHELLS]
+    ) & np.uint64(SUBSHELL_MASK)
+    occupancies[:, LOW_WORD_SUBSHELLS:] = (
+        packed[:, 1:] >> SHIFTS[: len(ORBITALS) - LOW_WORD_SUBSHELLS]
+    ) & np.uint64(SUBSHELL_MASK)
+    return occupancies
+
+
+def packed_to_keys(packed: np.ndarray) -> list[int]:
+    return [int(high) << 64 | int(low) for low, high in packed.tolist()]
+
+
+def deduplicate_occupancies(occupancies: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    unique, inverse = np.unique(pack_occupancies(occupancies), axis=0, return_inverse=True)
+    return unique, inverse.reshape(-1)
@@ -0,0 +1,84 @@
+from typing import Literal
+
+import re
+
+import numpy as np
+
+from electrons import FROM_SUPER, ORBITALS, SUBORBITAL_COUNTS, PhysicsError
+from species import (
+    LAST_SUBSHELLS,
+    OCCUPANCY_MATRIX,
+    ORBITAL_L,
+    ORBITAL_N,
+    SPECIES,
+    SPECIES_CHARGES,
+    VALENCE_SHELLS,
+)
+
+
+SUBORBITAL_CAPACITIES = [SUBORBITAL_COUNTS[letter] * 2 for letter in "spdf"]
+PATTERN_TERM = re.compile(r"^(\d+|n)([spdf])(\d+|[⁰¹²³⁴⁵⁶⁷⁸⁹]+|\*)?$")
+
+# Column of subshell (n, l) in ORBITALS, with an extra always-empty column for subshells that do not exist
+ORBITAL_COLUMNS = np.full((int(ORBITAL_N.max()) + 1, 4), len(ORBITALS), dtype=np.intp)
+ORBITAL_COLUMNS[ORBITAL_N, ORBITAL_L] = np.arange(len(ORBITALS))
+
+
+class ConfigurationPattern:
+    def __init__(self, pattern: str, anchor: Literal["any", "last", "valence"] = "any"):
+        self.pattern = pattern
+        self.anchor = anchor
+        self.terms = [self._compile_term(term) for term in pattern.replace(",", " ").split()]
+        if not self.terms:
+            raise PhysicsError("Pattern is empty.")
+        if anchor == "last" and len(self.terms) != 1:
+            raise PhysicsError("A pattern anchored to the last subshell takes exactly one term.")
+
+    @staticmethod
+    def _compile_term(term: str) -> tuple[int | None, int, int | None]:
+        match = PATTERN_TERM.match(term)
+        if match is None:
+            raise PhysicsError(f"Unrecognized pattern term: {term}")
+        n = None if match.group(1) == "n" else int(match.group(1))
+        l = "spdf".index(match.group(2))
+        if n is not None and (n, match.group(2)) not in ORBITALS:
+            raise PhysicsError(f"Subshell {n}{match.group(2)} is not supported.")
+        count = match.group(3) or "*"
+        count = None if count == "*" else int(count.translate(FROM_SUPER))
+        if count is not None and count > SUBORBITAL_CAPACITIES[l]:
+            raise PhysicsError(f"A {match.group(2)} subshell holds at most {SUBORBITAL_CAPACITIES[l]} electrons.")
+        return n, l, count
+
+    def mask(self, occupancies: np.ndarray = OCCUPANCY_MATRIX) -> np.ndarray:
+        if occupancies is OCCUPANCY_MATRIX:
+            valence_shells, last_subshells = VALENCE_SHELLS, LAST_SUBSHELLS
+        else:
+            valence_shells = np.where(occupancies > 0, ORBITAL_N, 0).max(axis=1)
+            last_subshells = len(ORBITALS) - 1 - np.argmax(occupancies[:, ::-1] > 0, axis=1)
+        padded = np.pad(occupancies, ((0, 0), (0, 1)))
+        rows = np.arange(len(occupancies))
+        result = np.ones(len(occupancies), dtype=bool)
+        for n, l, count in self.terms:
+            if self.anchor == "last":
+                columns = last_subshells
+                result &= ORBITAL_L[columns] == l
+                if n is not None:
+                    result &= ORBITAL_N[columns] == n
+                values = padded[rows, columns]
+            elif n is not None:
+                values = padded[:, ORBITAL_COLUMNS[n, l]]
+            elif self.anchor == "valence":
+                values = padded[rows, ORBITAL_COLUMNS[valence_shells, l]]
+            else:
+                values = occupancies[:, ORBITAL_L == l]
+                result &= ((values == count) if count is not None else (values > 0)).any(axis=1)
+                continue
+            result &= (values == count) if count is not None else (values > 0)
+        return result
+
+    def select(self, charge: int | None = None) -> tuple[tuple[int, int], ...]:
+        selected = self.mask()
+        if charge is not None:
+            selected &= SPECIES_CHARGES == charge
+        return tuple(SPECIES[index] for index in np.flatnonzero(selected))
+
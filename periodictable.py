@@ -2378,6 +2378,63 @@ ELEMENTS_DATA = {
     },
 }
 
+# Pauling electronegativities, None where no value is established
+ELECTRONEGATIVITIES = {
+    Element.H: 2.20, Element.He: None, Element.Li: 0.98, Element.Be: 1.57, Element.B: 2.04,
+    Element.C: 2.55, Element.N: 3.04, Element.O: 3.44, Element.F: 3.98, Element.Ne: None,
+    Element.Na: 0.93, Element.Mg: 1.31, Element.Al: 1.61, Element.Si: 1.90, Element.P: 2.19,
+    Element.S: 2.58, Element.Cl: 3.16, Element.Ar: None, Element.K: 0.82, Element.Ca: 1.00,
+    Element.Sc: 1.36, Element.Ti: 1.54, Element.V: 1.63, Element.Cr: 1.66, Element.Mn: 1.55,
+    Element.Fe: 1.83, Element.Co: 1.88, Element.Ni: 1.91, Element.Cu: 1.90, Element.Zn: 1.65,
+    Element.Ga: 1.81, Element.Ge: 2.01, Element.As: 2.18, Element.Se: 2.55, Element.Br: 2.96,
+    Element.Kr: 3.00, Element.Rb: 0.82, Element.Sr: 0.95, Element.Y: 1.22, Element.Zr: 1.33,
+    Element.Nb: 1.6, Element.Mo: 2.16, Element.Tc: 1.9, Element.Ru: 2.2, Element.Rh: 2.28,
+    Element.Pd: 2.20, Element.Ag: 1.93, Element.Cd: 1.69, Element.In: 1.78, Element.Sn: 1.96,
+    Element.Sb: 2.05, Element.Te: 2.1, Element.I: 2.66, Element.Xe: 2.60, Element.Cs: 0.79,
+    Element.Ba: 0.89, Element.La: 1.10, Element.Ce: 1.12, Element.Pr: 1.13, Element.Nd: 1.14,
+    Element.Pm: 1.13, Element.Sm: 1.17, Element.Eu: 1.2, Element.Gd: 1.2, Element.Tb: 1.1,
+    Element.Dy: 1.22, Element.Ho: 1.23, Element.Er: 1.24, Element.Tm: 1.25, Element.Yb: 1.1,
+    Element.Lu: 1.27, Element.Hf: 1.3, Element.Ta: 1.5, Element.W: 2.36, Element.Re: 1.9,
+    Element.Os: 2.2, Element.Ir: 2.20, Element.Pt: 2.28, Element.Au: 2.54, Element.Hg: 2.00,
+    Element.Tl: 1.62, Element.Pb: 1.87, Element.Bi: 2.02, Element.Po: 2.0, Element.At: 2.2,
+    Element.Rn: 2.2, Element.Fr: 0.7, Element.Ra: 0.9, Element.Ac: 1.1, Element.Th: 1.3,
+    Element.Pa: 1.5, Element.U: 1.38, Element.Np: 1.36, Element.Pu: 1.28, Element.Am: 1.13,
+    Element.Cm: 1.28, Element.Bk: 1.3, Element.Cf: 1.3, Element.Es: 1.3, Element.Fm: 1.3,
+    Element.Md: 1.3, Element.No: 1.3, Element.Lr: 1.3, Element.Rf: None, Element.Db: None,
+    Element.Sg: None, Element.Bh: None, Element.Hs: None, Element.Mt: None, Element.Ds: None,
+    Element.Rg: None, Element.Cn: None, Element.Nh: None, Element.Fl: None, Element.Mc: None,
+    Element.Lv: None, Element.Ts: None, Element.Og: None,
+}
+
+# Common oxidation states, most prevalent first
+COMMON_OXIDATION_STATES = {
+    Element.H: (1, -1), Element.He: (0,), Element.Li: (1,), Element.Be: (2,), Element.B: (3,),
+    Element.C: (4, -4, 2, -2, 0, -1, 1, 3, -3), Element.N: (-3, 5, 3, 4, 2, 1, -2, -1),
+    Element.O: (-2, -1), Element.F: (-1,), Element.Ne: (0,), Element.Na: (1,), Element.Mg: (2,),
+    Element.Al: (3,), Element.Si: (4, -4), Element.P: (5, 3, -3), Element.S: (-2, 6, 4, 2),
+    Element.Cl: (-1, 1, 3, 5, 7), Element.Ar: (0,), Element.K: (1,), Element.Ca: (2,), Element.Sc: (3,),
+    Element.Ti: (4, 3, 2), Element.V: (5, 4, 3, 2), Element.Cr: (3, 6, 2), Element.Mn: (2, 4, 7, 3, 6),
+    Element.Fe: (3, 2), Element.Co: (2, 3), Element.Ni: (2, 3), Element.Cu: (2, 1), Element.Zn: (2,),
+    Element.Ga: (3,), Element.Ge: (4, 2, -4), Element.As: (3, 5, -3), Element.Se: (-2, 4, 6),
+    Element.Br: (-1, 1, 3, 5), Element.Kr: (0, 2), Element.Rb: (1,), Element.Sr: (2,), Element.Y: (3,),
+    Element.Zr: (4,), Element.Nb: (5, 3), Element.Mo: (6, 4), Element.Tc: (7, 4), Element.Ru: (3, 4, 2),
+    Element.Rh: (3,), Element.Pd: (2, 4), Element.Ag: (1,), Element.Cd: (2,), Element.In: (3,),
+    Element.Sn: (4, 2, -4), Element.Sb: (3, 5, -3), Element.Te: (-2, 4, 6), Element.I: (-1, 1, 5, 7),
+    Element.Xe: (0, 2, 4, 6), Element.Cs: (1,), Element.Ba: (2,), Element.La: (3,), Element.Ce: (3, 4),
+    Element.Pr: (3,), Element.Nd: (3,), Element.Pm: (3,), Element.Sm: (3, 2), Element.Eu: (3, 2),
+    Element.Gd: (3,), Element.Tb: (3,), Element.Dy: (3,), Element.Ho: (3,), Element.Er: (3,),
+    Element.Tm: (3,), Element.Yb: (3, 2), Element.Lu: (3,), Element.Hf: (4,), Element.Ta: (5,),
+    Element.W: (6, 4), Element.Re: (4, 7), Element.Os: (4, 8), Element.Ir: (3, 4), Element.Pt: (2, 4),
+    Element.Au: (3, 1), Element.Hg: (2, 1), Element.Tl: (1, 3), Element.Pb: (2, 4), Element.Bi: (3, 5),
+    Element.Po: (4, 2, -2), Element.At: (-1, 1), Element.Rn: (0, 2), Element.Fr: (1,), Element.Ra: (2,),
+    Element.Ac: (3,), Element.Th: (4,), Element.Pa: (5,), Element.U: (6, 4), Element.Np: (5,),
+    Element.Pu: (4,), Element.Am: (3,), Element.Cm: (3,), Element.Bk: (3,), Element.Cf: (3,),
+    Element.Es: (3,), Element.Fm: (3,), Element.Md: (3,), Element.No: (2,), Element.Lr: (3,),
+    Element.Rf: (4,), Element.Db: (5,), Element.Sg: (6,), Element.Bh: (7,), Element.Hs: (8,),
+    Element.Mt: (3,), Element.Ds: (2,), Element.Rg: (3,), Element.Cn: (2,), Element.Nh: (1,),
+    Element.Fl: (2,), Element.Mc: (1,), Element.Lv: (2,), Element.Ts: (-1,), Element.Og: (0,),
+}
+
 # Mapping from element names (in lowercase) to their atomic numbers
 ELEMENT_NAME_TO_NUMBER = {
     data["name"].lower(): data["number"] for data in ELEMENTS_DATA.values()
@@ -0,0 +1,71 @@
+import numpy as np
+
+from electrons import MAX_ELECTRONS, PERIOD_OFFSETS, convert_to_script
+from species import SPECIES_ATOMIC_NUMBERS, SPECIES_CHARGES, SPECIES_INDEX
+
+
+# j-subshells (n, letter, 2j) in filling order. Up to Rn this is ORBITALS with the lower j of each pair first.
+# In period 7 spin-orbit coupling pulls 7p1/2 below 6d, giving Lr its 7p1/2 electron; one order cannot also
+# give Rf to Cn their 6d electrons ahead of it, so those come out with 7p1/2 already full
+JJ_ORBITALS = [
+    (1, "s", 1), (2, "s", 1), (2, "p", 1), (2, "p", 3),
+    (3, "s", 1), (3, "p", 1), (3, "p", 3), (4, "s", 1),
+    (3, "d", 3), (3, "d", 5), (4, "p", 1), (4, "p", 3), (5, "s", 1),
+    (4, "d", 3), (4, "d", 5), (5, "p", 1), (5, "p", 3), (6, "s", 1),
+    (4, "f", 5), (4, "f", 7), (5, "d", 3), (5, "d", 5), (6, "p", 1), (6, "p", 3),
+    (7, "s", 1), (5, "f", 5), (5, "f", 7), (7, "p", 1), (6, "d", 3), (6, "d", 5),
+    (7, "p", 3),
+]
+JJ_CAPACITIES = np.array([twice_j + 1 for _, _, twice_j in JJ_ORBITALS])
+# Cations lose electrons as in REMOVAL_ORDER, and the higher j of a pair first
+JJ_REMOVAL_ORDER = sorted(
+    range(len(JJ_ORBITALS)),
+    key=lambda index: (
+        JJ_ORBITALS[index][0] + PERIOD_OFFSETS[JJ_ORBITALS[index][1]],
+        "fdsp".index(JJ_ORBITALS[index][1]),
+        JJ_ORBITALS[index][2],
+    ),
+    reverse=True,
+)
+JJ_SUBSHELL_TERMS = [
+    [
+        f"{n}{letter}{convert_to_script(f'{twice_j}/2', 'sub')}{convert_to_script(electron_count)}"
+        for electron_count in range(twice_j + 2)
+    ]
+    for n, letter, twice_j in JJ_ORBITALS
+]
+
+
+def fill_jj_occupancies(electron_counts: np.ndarray) -> np.ndarray:
+    filled_before = np.cumsum(JJ_CAPACITIES) - JJ_CAPACITIES
+    return np.clip(np.asarray(electron_counts)[:, None] - filled_before, 0, JJ_CAPACITIES).astype(np.uint8)
+
+
+def build_jj_ion_occupancies(atomic_numbers: np.ndarray, charges: np.ndarray) -> np.ndarray:
+    ordered = fill_jj_occupancies(atomic_numbers).astype(np.int16)[:, JJ_REMOVAL_ORDER]
+    removed_before = np.cumsum(ordered, axis=1) - ordered
+    removed = np.clip(charges[:, None] - removed_before, 0, ordered)
+    ion_occupancies = fill_jj_occupancies(atomic_numbers - charges)
+    cations = charges > 0
+    ion_occupancies[np.ix_(cations, JJ_REMOVAL_ORDER)] = (ordered - removed)[cations]
+    return ion_occupancies
+
+
+def format_jj_configuration(jj_occupancy) -> str:
+    return " ".join(
+        JJ_SUBSHELL_TERMS[index][electrons] for index, electrons in enumerate(jj_occupancy) if electrons
+    )
+
+
+JJ_FILL_MATRIX = fill_jj_occupancies(np.arange(MAX_ELECTRONS + 1))
+JJ_OCCUPANCY_MATRIX = JJ_FILL_MATRIX[SPECIES_ATOMIC_NUMBERS - SPECIES_CHARGES]
+JJ_ION_OCCUPANCY_MATRIX = build_jj_ion_occupancies(SPECIES_ATOMIC_NUMBERS, SPECIES_CHARGES)
+for table in (JJ_FILL_MATRIX, JJ_OCCUPANCY_MATRIX, JJ_ION_OCCUPANCY_MATRIX):
+    table.flags.writeable = False
+JJ_CONFIGURATIONS = [format_jj_configuration(row) for row in JJ_FILL_MATRIX]
+
+
+def get_jj_electron_configuration(atomic_number: int, charge: int = 0) -> str:
+    if charge <= 0:
+        return JJ_CONFIGURATIONS[atomic_number - charge]
+    return format_jj_configuration(JJ_ION_OCCUPANCY_MATRIX[SPECIES_INDEX[atomic_number, charge]])
@@ -0,0 +1,65 @@
+from functools import lru_cache
+
+import numpy as np
+
+from electrons import PhysicsError
+from wavefunctions import radial_probability_density
+
+
+GRID_POINTS = 8193
+
+
+def build_inverse_cdf(grid: np.ndarray, density: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    cumulative = np.concatenate(([0.0], np.cumsum((density[1:] + density[:-1]) / 2 * np.diff(grid))))
+    cumulative /= cumulative[-1]
+    # Drop flat stretches so np.interp sees a strictly increasing CDF
+    keep = np.concatenate(([True], np.diff(cumulative) > 0))
+    return cumulative[keep], grid[keep]
+
+
+@lru_cache(maxsize=256)
+def get_radial_table(n: int, l: int, atomic_number: int) -> tuple[np.ndarray, np.ndarray]:
+    r = np.linspace(0, (4 * n * n + 20 * n) / atomic_number, GRID_POINTS)
+    return build_inverse_cdf(r, radial_probability_density(n, l, r, atomic_number))
+
+
+@lru_cache(maxsize=256)
+def get_angular_tables(l: int, m: int) -> tuple[tuple[np.ndarray, np.ndarray], tuple[np.ndarray, np.ndarray]]:
+    # |Y_lm|² of a real spherical harmonic factorizes into P_l^|m|(cos θ)² and cos² or sin² of |m|φ
+    x = np.linspace(-1, 1, GRID_POINTS)
+    legendre = np.polynomial.legendre.Legendre.basis(l).deriv(abs(m))(x) * (1 - x * x) ** (abs(m) / 2)
+    phi = np.linspace(0, 2 * np.pi, GRID_POINTS)
+    if m > 0:
+        azimuthal = np.cos(m * phi) ** 2
+    elif m < 0:
+        azimuthal = np.sin(-m * phi) ** 2
+    else:
+        azimuthal = np.ones_like(phi)
+    return build_inverse_cdf(x, legendre**2), build_inverse_cdf(phi, azimuthal)
+
+
+def iter_orbital_points(
+    n: int,
+    l: int,
+    m: int,
+    count: int,
+    atomic_number: int = 1,
+    chunk_size: int = 1_000_000,
+    seed: int | None = None,
+):
+    if not 0 <= l < n or abs(m) > l:
+        raise PhysicsError(f"No orbital with n={n}, l={l}, m={m}.")
+    rng = np.random.default_rng(seed)
+    radial_cdf, radii = get_radial_table(n, l, atomic_number)
+    (polar_cdf, cosines), (azimuthal_cdf, angles) = get_angular_tables(l, m)
+    for start in range(0, count, chunk_size):
+        size = min(chunk_size, count - start)
+        r = np.interp(rng.random(size), radial_cdf, radii)
+        cos_theta = np.interp(rng.random(size), polar_cdf, cosines)
+        phi = np.interp(rng.random(size), azimuthal_cdf, angles)
+        sin_theta = np.sqrt(1 - cos_theta**2)
+        yield np.column_stack((r * sin_theta * np.cos(phi), r * sin_theta * np.sin(phi), r * cos_theta))
+
+
+def sample_orbital(n: int, l: int, m: int, count: int, atomic_number: int = 1, seed: int | None = None) -> np.ndarray:
+    return np.concatenate(list(iter_orbital_points(n, l, m, count, atomic_number, seed=seed)))
@@ -0,0 +1,100 @@
+import numpy as np
+
+from dataset import get_dataset
+from descriptors import ELEMENT_DESCRIPTORS
+from periodictable import ELECTRONEGATIVITIES
+from species import (
+    ELEMENT_ROWS,
+    ION_OCCUPANCY_MATRIX,
+    SPECIES,
+    SPECIES_ATOMIC_NUMBERS,
+    SPECIES_CHARGES,
+    SPECIES_INDEX,
+    get_outer_counts_by_l,
+)
+
+
+NEIGHBOR_COUNT = 32
+BLOCK_SIZE = 512
+
+
+def build_feature_vectors(dataset) -> np.ndarray:
+    valence = get_outer_counts_by_l(ION_OCCUPANCY_MATRIX)
+    electronegativity = np.array(
+        [ELECTRONEGATIVITIES[number] for number in SPECIES_ATOMIC_NUMBERS], dtype=np.float64
+    )
+    periods = np.full(SPECIES_ATOMIC_NUMBERS.max() + 1, np.nan)
+    for number, data in dataset.elements.items():
+        if isinstance(data.get("period"), int):
+            periods[number] = data["period"]
+    period = periods[SPECIES_ATOMIC_NUMBERS]
+    group = ELEMENT_DESCRIPTORS["group"][SPECIES_ATOMIC_NUMBERS]
+    features = np.column_stack((valence, SPECIES_CHARGES, electronegativity, period, group)).astype(np.float64)
+
+    # z-score every column; missing values sit at the mean
+    features = (features - np.nanmean(features, axis=0)) / np.nanstd(features, axis=0)
+    features = np.nan_to_num(features)
+    features.flags.writeable = False
+    return features
+
+
+def get_feature_vectors() -> np.ndarray:
+    return get_dataset().derive("similarity-features", build_feature_vectors)
+
+
+ELEMENT_POSITIONS = {
+    atomic_number: position for position, atomic_number in enumerate(SPECIES_ATOMIC_NUMBERS[ELEMENT_ROWS].tolist())
+}
+
+
+def get_distances(features: np.ndarray, rows: np.ndarray, candidates: np.ndarray | None = None) -> np.ndarray:
+    vectors = features[rows]
+    candidates = features if candidates is None else candidates
+    squared = (vectors**2).sum(axis=1)[:, None] + (candidates**2).sum(axis=1)[None, :] - 2 * vectors @ candidates.T
+    return np.sqrt(np.clip(squared, 0, None))
+
+
+def build_neighbor_index(dataset) -> tuple[np.ndarray, np.ndarray]:
+    # The full species matrix would be tens of millions of entries, so only the nearest neighbours are kept
+    features = dataset.derive("similarity-features", build_feature_vectors)
+    neighbors = np.empty((len(SPECIES), NEIGHBOR_COUNT), dtype=np.int32)
+    distances = np.empty((len(SPECIES), NEIGHBOR_COUNT))
+    for start in range(0, len(SPECIES), BLOCK_SIZE):
+        rows = np.arange(start, min(start + BLOCK_SIZE, len(SPECIES)))
+        block = get_distances(features, rows)
+        block[np.arange(len(rows)), rows] = np.inf
+        nearest = np.argpartition(block, NEIGHBOR_COUNT, axis=1)[:, :NEIGHBOR_COUNT]
+        nearest_distances = np.take_along_axis(block, nearest, axis=1)
+        order = np.argsort(nearest_distances, axis=1)
+        neighbors[rows] = np.take_along_axis(nearest, order, axis=1)
+        distances[rows] = np.take_along_axis(nearest_distances, order, axis=1)
+    neighbors.flags.writeable = False
+    distances.flags.writeable = False
+    return neighbors, distances
+
+
+def build_element_neighbor_index(dataset) -> tuple[list[list[int]], list[list[float]]]:
+    # Every other element in order of distance, kept as lists so a query is two slices
+    features = dataset.derive("similarity-features", build_feature_vectors)
+    distances = get_distances(features, ELEMENT_ROWS, features[ELEMENT_ROWS])
+    np.fill_diagonal(distances, np.inf)
+    order = np.argsort(distances, axis=1, kind="stable")[:, :-1]
+    neighbors = SPECIES_ATOMIC_NUMBERS[ELEMENT_ROWS][order]
+    return neighbors.tolist(), np.take_along_axis(distances, order, axis=1).tolist()
+
+
+def most_similar_elements(atomic_number: int, k: int = 5) -> list[tuple[int, float]]:
+    neighbors, distances = get_dataset().derive("similarity-element-neighbors", build_element_neighbor_index)
+    position = ELEMENT_POSITIONS[atomic_number]
+    return list(zip(neighbors[position][:k], distances[position][:k]))
+
+
+def most_similar_species(atomic_number: int, charge: int = 0, k: int = 5) -> list[tuple[tuple[int, int], float]]:
+    row = SPECIES_INDEX[atomic_number, charge]
+    if k <= NEIGHBOR_COUNT:
+        neighbors, distances = get_dataset().derive("similarity-neighbors", build_neighbor_index)
+        return [(SPECIES[index], float(distance)) for index, distance in zip(neighbors[row, :k], distances[row, :k])]
+    distances = get_distances(get_feature_vectors(), np.array([row]))[0]
+    distances[row] = np.inf
+    nearest = np.argsort(distances)[:k]
+    return [(SPECIES[index], float(distances[index])) for index in nearest]
@@ -0,0 +1,62 @@
+import numpy as np
+
+from species import OCCUPANCY_MATRIX, ORBITAL_L, ORBITAL_N, SPECIES_ATOMIC_NUMBERS, SPECIES_INDEX
+
+
+BOHR_RADIUS = 0.529177210903  # Ångström
+EFFECTIVE_PRINCIPAL_NUMBERS = {1: 1.0, 2: 2.0, 3: 3.0, 4: 3.7, 5: 4.0, 6: 4.2, 7: 4.3}
+
+
+def get_slater_group(n: int, l: int) -> tuple[int, int]:
+    # s and p share a group; groups are ordered 1s, 2sp, 3sp, 3d, 4sp, 4d, 4f, ...
+    return n, max(l - 1, 0)
+
+
+def build_screening_matrix() -> np.ndarray:
+    groups = [get_slater_group(int(n), int(l)) for n, l in zip(ORBITAL_N, ORBITAL_L)]
+    screening = np.zeros((len(groups), len(groups)))
+    for target, (n, kind) in enumerate(groups):
+        for source, group in enumerate(groups):
+            if group == (n, kind):
+                screening[target, source] = 0.30 if n == 1 else 0.35
+            elif group > (n, kind):
+                continue
+            elif kind > 0:
+                screening[target, source] = 1.00
+            elif group[0] == n - 1:
+                screening[target, source] = 0.85
+            elif group[0] < n - 1:
+                screening[target, source] = 1.00
+    return screening
+
+
+# SCREENING_MATRIX[i, j] is the shielding of subshell i by one electron in subshell j
+SCREENING_MATRIX = build_screening_matrix()
+EFFECTIVE_N = np.array([EFFECTIVE_PRINCIPAL_NUMBERS[int(n)] for n in ORBITAL_N])
+
+
+def get_screening_constants(occupancies: np.ndarray) -> np.ndarray:
+    occupancies = np.asarray(occupancies, dtype=np.float64)
+    screening = occupancies @ SCREENING_MATRIX.T - np.diag(SCREENING_MATRIX)
+    return np.where(occupancies > 0, screening, np.nan)
+
+
+def get_effective_nuclear_charges(occupancies: np.ndarray, atomic_numbers: np.ndarray) -> np.ndarray:
+    return np.asarray(atomic_numbers, dtype=np.float64)[:, None] - get_screening_constants(occupancies)
+
+
+def get_orbital_radii(effective_charges: np.ndarray) -> np.ndarray:
+    # Subshells with no net attraction (highly charged anions) are unbound and get no radius
+    bound = np.where(effective_charges > 0, effective_charges, np.nan)
+    return EFFECTIVE_N**2 * BOHR_RADIUS / bound
+
+
+SCREENING_CONSTANTS = get_screening_constants(OCCUPANCY_MATRIX)
+EFFECTIVE_NUCLEAR_CHARGES = get_effective_nuclear_charges(OCCUPANCY_MATRIX, SPECIES_ATOMIC_NUMBERS)
+ORBITAL_RADII = get_orbital_radii(EFFECTIVE_NUCLEAR_CHARGES)
+for table in (SCREENING_CONSTANTS, EFFECTIVE_NUCLEAR_CHARGES, ORBITAL_RADII):
+    table.flags.writeable = False
+
+
+def get_effective_nuclear_charge(atomic_number: int, charge: int = 0) -> np.ndarray:
+    return EFFECTIVE_NUCLEAR_CHARGES[SPECIES_INDEX[atomic_number, charge]]
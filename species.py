@@ -0,0 +1,105 @@
+import numpy as np
+
+from dataset import get_dataset
+from electrons import (
+    MAX_ELECTRONS,
+    NOBLE_GASES,
+    ORBITALS,
+    REMOVAL_ORDER,
+    convert_to_script,
+    get_occupancy,
+    parse_electron_configuration,
+)
+from packing import encode_occupancy
+from periodictable import ELEMENTS_DATA
+
+
+MAX_ANION_CHARGE = 3
+
+
+def iter_species():
+    for atomic_number in ELEMENTS_DATA:
+        for charge in range(-MAX_ANION_CHARGE, atomic_number):
+            if atomic_number - charge <= MAX_ELECTRONS:
+                yield atomic_number, charge
+
+
+SPECIES = tuple(iter_species())
+SPECIES_INDEX = {entry: index for index, entry in enumerate(SPECIES)}
+# Neutral-atom row of every element, in atomic-number order
+ELEMENT_ROWS = np.array([SPECIES_INDEX[atomic_number, 0] for atomic_number in sorted(ELEMENTS_DATA)])
+SPECIES_OCCUPANCIES = tuple(get_occupancy(atomic_number - charge) for atomic_number, charge in SPECIES)
+
+
+def build_ion_occupancies(atomic_numbers: np.ndarray, charges: np.ndarray, occupancies: np.ndarray) -> np.ndarray:
+    neutral = np.array([get_occupancy(atomic_number) for atomic_number in range(int(atomic_numbers.max()) + 1)])
+    ordered = neutral[atomic_numbers][:, REMOVAL_ORDER]
+    removed_before = np.cumsum(ordered, axis=1) - ordered
+    removed = np.clip(charges[:, None] - removed_before, 0, ordered)
+    ion_occupancies = np.array(occupancies, dtype=np.uint8)
+    cations = charges > 0
+    ion_occupancies[np.ix_(cations, REMOVAL_ORDER)] = (ordered - removed)[cations]
+    return ion_occupancies
+
+
+ORBITAL_N = np.array([orbital[0] for orbital in ORBITALS], dtype=np.int8)
+ORBITAL_L = np.array(["spdf".index(orbital[1]) for orbital in ORBITALS], dtype=np.int8)
+SPECIES_ATOMIC_NUMBERS = np.array([entry[0] for entry in SPECIES], dtype=np.int16)
+SPECIES_CHARGES = np.array([entry[1] for entry in SPECIES], dtype=np.int16)
+OCCUPANCY_MATRIX = np.array(SPECIES_OCCUPANCIES, dtype=np.uint8)
+OCCUPANCY_MATRIX.flags.writeable = False
+ION_OCCUPANCY_MATRIX = build_ion_occupancies(SPECIES_ATOMIC_NUMBERS, SPECIES_CHARGES, OCCUPANCY_MATRIX)
+ION_OCCUPANCY_MATRIX.flags.writeable = False
+VALENCE_SHELLS = np.where(OCCUPANCY_MATRIX > 0, ORBITAL_N, 0).max(axis=1)
+LAST_SUBSHELLS = len(ORBITALS) - 1 - np.argmax(OCCUPANCY_MATRIX[:, ::-1] > 0, axis=1)
+CORE_ELECTRONS = [electron_count for electron_count, _, _ in NOBLE_GASES]
+CORE_OCCUPANCIES = np.array([get_occupancy(electron_count) for electron_count in [0] + CORE_ELECTRONS], dtype=np.int16)
+
+
+def get_outer_occupancies(occupancies) -> np.ndarray:
+    # Subtracts the largest noble-gas core with fewer electrons than the row, as the short configuration does
+    occupancies = np.asarray(occupancies, dtype=np.int16)
+    cores = CORE_OCCUPANCIES[np.searchsorted(CORE_ELECTRONS, occupancies.sum(axis=1))]
+    return occupancies - cores
+
+
+def get_outer_counts_by_l(occupancies) -> np.ndarray:
+    outer = get_outer_occupancies(occupancies)
+    return np.stack([outer[:, ORBITAL_L == l].sum(axis=1) for l in range(4)], axis=1)
+
+
+def format_charge(charge: int) -> str:
+    if charge == 0:
+        return ""
+    sign = "+" if charge > 0 else "-"
+    return convert_to_script(f"{abs(charge) if abs(charge) > 1 else ''}{sign}")
+
+
+def format_species(atomic_number: int, charge: int = 0) -> str:
+    return (
+        convert_to_script(atomic_number, "sub")
+        + get_dataset().elements[atomic_number]["symbol"]
+        + format_charge(charge)
+    )
+
+
+def build_configuration_index(species=SPECIES, occupancies=SPECIES_OCCUPANCIES, *extra_occupancies) -> dict:
+    index = {}
+    for occupancy_table in (occupancies, *extra_occupancies):
+        for entry, occupancy in zip(species, occupancy_table):
+            index.setdefault(encode_occupancy(occupancy), {})[entry] = None
+    return {
+        key: tuple(sorted(entries, key=lambda entry: (abs(entry[1]), entry[1])))
+        for key, entries in index.items()
+    }
+
+
+# Ions are indexed under both the plain Aufbau form and the removal-order form
+CONFIGURATION_INDEX = build_configuration_index(SPECIES, SPECIES_OCCUPANCIES, ION_OCCUPANCY_MATRIX.tolist())
+
+
+def find_species(configuration: str, charge: int | None = None) -> tuple[tuple[int, int], ...]:
+    matches = CONFIGURATION_INDEX.get(encode_occupancy(parse_electron_configuration(configuration)), ())
+    if charge is not None:
+        return tuple(entry for entry in matches if entry[1] == charge)
+    return matches
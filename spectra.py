@@ -0,0 +1,47 @@
+import numpy as np
+
+from slater import EFFECTIVE_N, EFFECTIVE_NUCLEAR_CHARGES
+from species import ELEMENT_ROWS, OCCUPANCY_MATRIX, SPECIES_INDEX
+
+
+RYDBERG_ENERGY = 13.605693122994  # eV
+# Binding energies run from a few eV (valence) to ~100 keV (1s of superheavies), so the shared grid is logarithmic
+ENERGY_GRID = np.geomspace(1.0, 2.0e5, 4096)
+
+
+def get_binding_energies(effective_charges: np.ndarray) -> np.ndarray:
+    # Hydrogenic estimate from Slater's effective charge and effective principal quantum number
+    return RYDBERG_ENERGY * (np.clip(np.nan_to_num(effective_charges), 0, None) / EFFECTIVE_N) ** 2
+
+
+def render_spectra(
+    energies: np.ndarray,
+    intensities: np.ndarray,
+    grid: np.ndarray = ENERGY_GRID,
+    relative_width: float = 0.02,
+    chunk_size: int = 16,
+) -> np.ndarray:
+    energies = np.atleast_2d(energies)
+    intensities = np.atleast_2d(intensities).astype(np.float64)
+    widths = np.maximum(relative_width * energies, grid[0] * relative_width)
+    spectra = np.empty((len(energies), len(grid)))
+    for start in range(0, len(energies), chunk_size):
+        stop = start + chunk_size
+        offsets = (grid[None, None, :] - energies[start:stop, :, None]) / widths[start:stop, :, None]
+        peaks = np.exp(-0.5 * offsets**2)
+        spectra[start:stop] = np.einsum("sk,skg->sg", intensities[start:stop], peaks)
+    return spectra
+
+
+def get_species_spectra(rows: np.ndarray, grid: np.ndarray = ENERGY_GRID, **options) -> np.ndarray:
+    energies = get_binding_energies(EFFECTIVE_NUCLEAR_CHARGES[rows])
+    intensities = np.where(energies > 0, OCCUPANCY_MATRIX[rows], 0)
+    return render_spectra(energies, intensities, grid, **options)
+
+
+def get_element_spectra(grid: np.ndarray = ENERGY_GRID, **options) -> np.ndarray:
+    return get_species_spectra(ELEMENT_ROWS, grid, **options)
+
+
+def get_species_spectrum(atomic_number: int, charge: int = 0, grid: np.ndarray = ENERGY_GRID, **options) -> np.ndarray:
+    return get_species_spectra(np.array([SPECIES_INDEX[atomic_number, charge]]), grid, **options)[0]
@@ -0,0 +1,48 @@
+import csv
+import sys
+
+import numpy as np
+
+from dataset import get_dataset
+
+
+RYDBERG_CONSTANT = 10973731.568160  # m⁻¹
+ELECTRON_MASS = 5.48579909065e-4  # u
+SERIES_NAMES = {1: "Lyman", 2: "Balmer", 3: "Paschen", 4: "Brackett", 5: "Pfund", 6: "Humphreys"}
+
+
+def get_rydberg_constant(atomic_number: int) -> float:
+    # A one-electron ion's nucleus is the atomic mass minus all Z electrons
+    nuclear_mass = get_dataset().atomic_masses[atomic_number] - atomic_number * ELECTRON_MASS
+    return RYDBERG_CONSTANT / (1 + ELECTRON_MASS / nuclear_mass)
+
+
+def get_series(atomic_number: int, lower: int, n_max: int) -> tuple[np.ndarray, np.ndarray]:
+    upper = np.arange(lower + 1, n_max + 1)
+    term_differences = 1 / lower**2 - 1 / upper.astype(np.float64) ** 2
+    wavenumbers = get_rydberg_constant(atomic_number) * atomic_number**2 * term_differences
+    return upper, 1e9 / wavenumbers  # nm, vacuum
+
+
+def iter_line_tables(n_max: int, atomic_numbers=None):
+    for atomic_number in atomic_numbers or sorted(get_dataset().elements):
+        for lower in range(1, n_max):
+            upper, wavelengths = get_series(atomic_number, lower, n_max)
+            yield atomic_number, lower, upper, wavelengths
+
+
+def write_line_table_csv(output, n_max: int, atomic_numbers=None):
+    writer = csv.writer(output)
+    writer.writerow(["symbol", "number", "series", "lower", "upper", "wavelength-nm"])
+    elements = get_dataset().elements
+    for atomic_number, lower, upper, wavelengths in iter_line_tables(n_max, atomic_numbers):
+        symbol = elements[atomic_number]["symbol"]
+        series = SERIES_NAMES.get(lower, f"n={lower}")
+        writer.writerows(
+            (symbol, atomic_number, series, lower, level, f"{wavelength:.6f}")
+            for level, wavelength in zip(upper.tolist(), wavelengths.tolist())
+        )
+
+
+if __name__ == "__main__":
+    write_line_table_csv(sys.stdout, int(sys.argv[1]) if len(sys.argv) > 1 else 10)
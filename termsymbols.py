@@ -0,0 +1,87 @@
+from collections import Counter
+from functools import lru_cache
+from itertools import combinations
+
+from electrons import ORBITALS, SUBSHELL_CAPACITIES, convert_to_script, get_occupancy
+from packing import decode_occupancy, encode_occupancy
+
+
+L_LETTERS = "SPDFGHIKLMNOQRTUV"
+
+
+@lru_cache(maxsize=None)
+def get_microstates(l: int, electron_count: int) -> tuple[tuple[tuple[int, int], int], ...]:
+    # Spin-orbitals as (m_l, 2 * m_s); the histogram maps (M_L, 2 * M_S) to its microstate count
+    spin_orbitals = [(ml, twice_ms) for ml in range(-l, l + 1) for twice_ms in (1, -1)]
+    histogram = Counter()
+    for occupied in combinations(spin_orbitals, electron_count):
+        histogram[sum(orbital[0] for orbital in occupied), sum(orbital[1] for orbital in occupied)] += 1
+    return tuple(sorted(histogram.items()))
+
+
+@lru_cache(maxsize=None)
+def combine_microstates(open_subshells: tuple[tuple[int, int], ...]) -> tuple[tuple[tuple[int, int], int], ...]:
+    histogram = {(0, 0): 1}
+    for l, electron_count in open_subshells:
+        combined = Counter()
+        for (total_ml, total_ms), count in histogram.items():
+            for (ml, ms), subshell_count in get_microstates(l, electron_count):
+                combined[total_ml + ml, total_ms + ms] += count * subshell_count
+        histogram = combined
+    return tuple(sorted(histogram.items()))
+
+
+def hund_ground_term(l: int, electron_count: int) -> tuple[int, int, int]:
+    orbital_count = 2 * l + 1
+    up = min(electron_count, orbital_count)
+    down = electron_count - up
+    unpaired = up - down
+    total_l = abs(sum(range(l, l - up, -1)) + sum(range(l, l - down, -1)))
+    return unpaired + 1, total_l, get_twice_j(total_l, unpaired, electron_count, orbital_count)
+
+
+def get_twice_j(total_l: int, twice_s: int, electron_count: int, orbital_count: int) -> int:
+    if electron_count < orbital_count:
+        return abs(2 * total_l - twice_s)
+    return 2 * total_l + twice_s
+
+
+@lru_cache(maxsize=None)
+def open_shell_ground_term(open_subshells: tuple[tuple[int, int], ...]) -> tuple[int, int, int]:
+    if not open_subshells:
+        return 1, 0, 0
+    if len(open_subshells) == 1:
+        return hund_ground_term(*open_subshells[0])
+    histogram = dict(combine_microstates(open_subshells))
+    twice_s = max(twice_ms for _, twice_ms in histogram)
+    total_l = max(ml for ml, twice_ms in histogram if twice_ms == twice_s)
+    # Hund's third rule is taken from the last open subshell
+    l, electron_count = open_subshells[-1]
+    return twice_s + 1, total_l, get_twice_j(total_l, twice_s, electron_count, 2 * l + 1)
+
+
+def get_open_subshells(occupancy) -> tuple[tuple[int, int], ...]:
+    return tuple(
+        ("spdf".index(ORBITALS[index][1]), electrons)
+        for index, electrons in enumerate(occupancy)
+        if 0 < electrons < SUBSHELL_CAPACITIES[index]
+    )
+
+
+@lru_cache(maxsize=4096)
+def get_packed_ground_term(key: int) -> tuple[int, int, int]:
+    return open_shell_ground_term(get_open_subshells(decode_occupancy(key)))
+
+
+def get_ground_term(occupancy) -> tuple[int, int, int]:
+    return get_packed_ground_term(encode_occupancy(occupancy))
+
+
+def format_term_symbol(term: tuple[int, int, int]) -> str:
+    multiplicity, total_l, twice_j = term
+    j = str(twice_j // 2) if twice_j % 2 == 0 else f"{twice_j}/2"
+    return convert_to_script(multiplicity) + L_LETTERS[total_l] + convert_to_script(j, "sub")
+
+
+def get_term_symbol(electron_count: int) -> str:
+    return format_term_symbol(get_ground_term(get_occupancy(electron_count)))
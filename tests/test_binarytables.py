@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from binarytables import FORMAT_VERSION, HEADER, MAGIC, BinaryTables, write_tables
+from periodictable import ELEMENTS_DATA
+from species import ION_OCCUPANCY_MATRIX, OCCUPANCY_MATRIX, SPECIES, SPECIES_INDEX
+
+
+@pytest.fixture(scope="module")
+def tables_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("tables") / "tables.bin"
+    write_tables(str(path))
+    return path
+
+
+@pytest.fixture
+def tables(tables_path):
+    tables = BinaryTables(str(tables_path))
+    yield tables
+    tables.close()
+
+
+def test_occupancies_round_trip(tables):
+    for atomic_number, charge in [(1, 0), (1, -3), (26, 3), (26, 25), (58, 3), (118, 0), (118, 117)]:
+        row = SPECIES_INDEX[atomic_number, charge]
+        assert tables.occupancy(atomic_number, charge) == tuple(ION_OCCUPANCY_MATRIX[row].tolist())
+        assert tables.occupancy(atomic_number, charge, ion=False) == tuple(OCCUPANCY_MATRIX[row].tolist())
+    for atomic_number, charge in [(1, 1), (26, -4), (118, 118)]:
+        with pytest.raises(KeyError):
+            tables.occupancy(atomic_number, charge)
+
+
+def test_arrays_match_species_tables(tables):
+    ion_occupancies = tables.array("ion-occupancies")
+    assert np.array_equal(ion_occupancies, ION_OCCUPANCY_MATRIX)
+    assert tables.view("species-numbers").tolist() == [atomic_number for atomic_number, _ in SPECIES]
+    del ion_occupancies
+
+
+@pytest.mark.parametrize(
+    "name, atomic_number",
+    [("iron", 26), ("Fe", 26), ("fe", 26), ("hydrogen", 1), ("zelezo", 26), ("Og", 118), ("unobtainium", None)],
+)
+def test_atomic_number_lookup(tables, name, atomic_number):
+    assert tables.atomic_number(name) == atomic_number
+
+
+def test_close_refuses_while_arrays_are_alive(tables_path):
+    tables = BinaryTables(str(tables_path))
+    masses = tables.array("atomic-mass")
+    with pytest.raises(BufferError):
+        tables.close()
+    assert tables.occupancy(26, 3) == tuple(ION_OCCUPANCY_MATRIX[SPECIES_INDEX[26, 3]].tolist())
+    assert masses[26] == ELEMENTS_DATA[26]["atomic-mass"]
+    del masses
+    tables.close()
+
+
+@pytest.mark.parametrize(
+    "header, message",
+    [
+        (HEADER.pack(b"NOTTABLE", FORMAT_VERSION, 0), "not an element table"),
+        (HEADER.pack(MAGIC, FORMAT_VERSION + 1, 0), "table format"),
+    ],
+)
+def test_rejects_foreign_files(tables_path, tmp_path, header, message):
+    path = tmp_path / "tables.bin"
+    path.write_bytes(header + tables_path.read_bytes()[HEADER.size:])
+    with pytest.raises(ValueError, match=message):
+        BinaryTables(str(path))
@@ -0,0 +1,31 @@
+import pytest
+
+from crystalfield import CRYSTAL_FIELD_TABLE, get_crystal_field, get_d_electron_count
+
+
+@pytest.mark.parametrize(
+    "d_count, geometry, spin, levels, cfse, pairings, unpaired",
+    [
+        (6, "octahedral", "low", {"t2g": 6, "eg": 0}, -2.4, 2, 0),
+        (6, "octahedral", "high", {"t2g": 4, "eg": 2}, -0.4, 0, 4),
+        (4, "octahedral", "high", {"t2g": 3, "eg": 1}, -0.6, 0, 4),
+        (4, "octahedral", "low", {"t2g": 4, "eg": 0}, -1.6, 1, 2),
+        (8, "octahedral", "low", {"t2g": 6, "eg": 2}, -1.2, 0, 2),
+        (10, "octahedral", "high", {"t2g": 6, "eg": 4}, 0.0, 0, 0),
+        (1, "tetrahedral", "high", {"e": 1, "t2": 0}, -0.6, 0, 1),
+        (8, "square-planar", "low", {"eg": 4, "a1g": 2, "b2g": 2, "b1g": 0}, -2.456, 1, 0),
+    ],
+)
+def test_crystal_field_table(d_count, geometry, spin, levels, cfse, pairings, unpaired):
+    entry = CRYSTAL_FIELD_TABLE[d_count, geometry, spin]
+    assert entry["levels"] == levels
+    assert entry["cfse"] == pytest.approx(cfse)
+    assert entry["pairings"] == pairings
+    assert entry["unpaired"] == unpaired
+
+
+def test_species_use_the_ion_d_count():
+    assert get_d_electron_count(26, 3) == 5
+    assert get_d_electron_count(27, 3) == 6
+    assert get_d_electron_count(30, 2) == 10
+    assert get_crystal_field(27, 3, spin="low")["cfse"] == pytest.approx(-2.4)
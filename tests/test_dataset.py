@@ -0,0 +1,83 @@
+import io
+import json
+
+import numpy as np
+import pytest
+
+import dataset
+from electrons import parse_species
+from featurizer import FEATURE_NAMES, featurize
+from formulas import parse_formula
+from molarmass import build_compositions, get_molar_masses
+from oxidation import describe_oxidation_states
+from spectrallines import write_line_table_csv
+from species import format_species
+
+
+@pytest.fixture
+def updated_dataset(tmp_path, monkeypatch):
+    monkeypatch.setattr(dataset, "_current", dataset.get_dataset())
+    path = tmp_path / "elements.json"
+    dataset.export_dataset(path)
+    elements = json.loads(path.read_text(encoding="utf-8"))["elements"]
+    elements[25]["atomic-mass"] = 60.0
+    elements[117].update(symbol="Ox", name="Oxium")
+    # Keys before the element list may hold lists of their own
+    path.write_text(json.dumps({"meta": {"tags": ["a", 1]}, "elements": elements, "notes": [2]}), encoding="utf-8")
+    return path
+
+
+def test_swap_reaches_lookups(updated_dataset, tmp_path):
+    assert parse_formula("Fe2O3") == (((8, 3), (26, 2)), 0)
+    before = featurize(["Fe"])[0, FEATURE_NAMES.index("mean-atomic-mass")]
+    dataset.swap_dataset(updated_dataset, tmp_path / "cache")
+    assert get_molar_masses(*build_compositions(["Fe"])[:3])[0] == pytest.approx(60.0)
+    assert featurize(["Fe"])[0, FEATURE_NAMES.index("mean-atomic-mass")] == pytest.approx(60.0) != before
+    assert parse_formula("Ox") == (((118, 1),), 0)
+    assert parse_species("oxium") == (118, 0)
+    assert format_species(118) == "₁₁₈Ox"
+    assert [atom["symbol"] for atom in describe_oxidation_states("Ox")] == ["Ox"]
+    output = io.StringIO()
+    write_line_table_csv(output, 3, [118])
+    assert output.getvalue().splitlines()[1].startswith("Ox,118,Lyman")
+    # Aliases from the built-in table keep working
+    assert parse_species("zelezo 3+") == (26, 3)
+
+
+def test_cached_dataset_matches(updated_dataset, tmp_path):
+    first = dataset.load_dataset(updated_dataset, tmp_path / "cache")
+    second = dataset.load_dataset(updated_dataset, tmp_path / "cache")
+    assert second.version == first.version
+    assert second.symbol_to_number == first.symbol_to_number
+    assert np.array_equal(second.atomic_masses, first.atomic_masses, equal_nan=True)
+
+
+def test_swap_rejects_missing_elements(tmp_path, monkeypatch):
+    monkeypatch.setattr(dataset, "_current", dataset.get_dataset())
+    path = tmp_path / "elements.json"
+    dataset.export_dataset(path, {1: dataset.get_dataset().elements[1]})
+    with pytest.raises(ValueError):
+        dataset.swap_dataset(path, None)
+    assert dataset.get_dataset().version == "builtin"
+
+
+@pytest.mark.parametrize(
+    "text, count",
+    [
+        ('[{"number": 1}, {"number": 2}]', 2),
+        ('{"version": 3, "elements": []}', 0),
+        ('{"a": {"b": [{"number": 5}]}, "elements": [{"number": 1}]}', 1),
+    ],
+)
+def test_iter_json_elements_reads_the_element_list(tmp_path, monkeypatch, text, count):
+    monkeypatch.setattr(dataset, "READ_SIZE", 4)
+    path = tmp_path / "elements.json"
+    path.write_text(text, encoding="utf-8")
+    assert [element["number"] for element in dataset.iter_json_elements(path)] == [1, 2][:count]
+
+
+def test_iter_json_elements_requires_an_element_list(tmp_path):
+    path = tmp_path / "elements.json"
+    path.write_text('{"meta": {"tags": ["a"]}}', encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(dataset.iter_json_elements(path))
@@ -0,0 +1,23 @@
+import numpy as np
+
+from descriptors import get_element_descriptors
+from species import OCCUPANCY_MATRIX, SPECIES_INDEX, get_outer_counts_by_l
+
+
+def test_valence_electrons():
+    valence = {symbol: get_element_descriptors(number)["valence-electrons"] for symbol, number in [
+        ("Na", 11), ("C", 6), ("Fe", 26), ("Zn", 30), ("Ga", 31), ("Tl", 81), ("Hf", 72),
+    ]}
+    assert valence == {"Na": 1, "C": 4, "Fe": 8, "Zn": 12, "Ga": 3, "Tl": 3, "Hf": 4}
+
+
+def test_f_block_valence_excludes_all_f_electrons():
+    lanthanides = [get_element_descriptors(number)["valence-electrons"] for number in range(57, 72)]
+    actinides = [get_element_descriptors(number)["valence-electrons"] for number in range(89, 104)]
+    assert lanthanides == [2] * 14 + [3]
+    assert actinides == [2] * 14 + [3]
+
+
+def test_outer_counts_by_l():
+    rows = [SPECIES_INDEX[26, 0], SPECIES_INDEX[17, -1], SPECIES_INDEX[2, 0]]
+    assert np.array_equal(get_outer_counts_by_l(OCCUPANCY_MATRIX[rows]), [[2, 0, 6, 0], [2, 6, 0, 0], [2, 0, 0, 0]])
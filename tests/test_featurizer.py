@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from featurizer import FEATURE_NAMES, featurize, featurize_to_npy
+
+
+def test_failed_formulas_do_not_change_other_rows():
+    alone = featurize(["H2O"])
+    mixed = featurize(["Xx", "H2O", "Xx", "NaCl", "Xx"])
+    assert np.allclose(mixed[1], alone[0], equal_nan=True)
+    assert np.allclose(mixed[3], featurize(["NaCl"])[0], equal_nan=True)
+    assert np.isnan(mixed[[0, 2, 4]]).all()
+
+
+def test_mean_atomic_number():
+    features = featurize(["H2O", "Xx"])
+    assert features[0, FEATURE_NAMES.index("mean-number")] == pytest.approx(10 / 3)
+    assert np.isnan(featurize(["Xx"])).all()
+
+
+def test_featurize_to_npy_chunks(tmp_path):
+    formulas = ["H2O", "Xx", "CO2", "Xx", "NaCl"]
+    output = featurize_to_npy(iter(formulas), tmp_path / "features.npy", count=5, chunk_size=2)
+    assert np.allclose(output, featurize(formulas), equal_nan=True)
+
+
+def test_featurize_to_npy_rejects_short_input(tmp_path):
+    with pytest.raises(ValueError):
+        featurize_to_npy(iter(["H2O"]), tmp_path / "features.npy", count=3)
@@ -0,0 +1,27 @@
+import pytest
+
+from electrons import PhysicsError
+from formulas import parse_formula
+
+
+@pytest.mark.parametrize(
+    "formula, expected",
+    [
+        ("H2O", (((1, 2), (8, 1)), 0)),
+        ("Fe^2+", (((26, 1),), 2)),
+        ("Fe 2+", (((26, 1),), 2)),
+        ("Fe²⁺", (((26, 1),), 2)),
+        ("NH4^+", (((1, 4), (7, 1)), 1)),
+        ("OH-", (((1, 1), (8, 1)), -1)),
+        ("[Co(NH3)6]3+", (((1, 18), (7, 6), (27, 1)), 3)),
+        ("CuSO4·5H2O", (((1, 10), (8, 9), (16, 1), (29, 1)), 0)),
+    ],
+)
+def test_parse_formula(formula, expected):
+    assert parse_formula(formula) == expected
+
+
+@pytest.mark.parametrize("formula", ["Fe2+", "NH4+", "O2-"])
+def test_count_before_bare_sign_is_ambiguous(formula):
+    with pytest.raises(PhysicsError, match="Ambiguous charge"):
+        parse_formula(formula)
@@ -0,0 +1,34 @@
+import io
+
+from grading import grade_csv, grade_submission
+
+
+def test_removal_order_answer_is_correct():
+    assert grade_submission("Fe3+", "[Ar] 3d5") == (True, "")
+    assert grade_submission("Na", "1s2 2s2 2p6 3s1") == (True, "")
+    assert grade_submission("Ce3+", "[Xe] 4f1") == (True, "")
+    assert grade_submission("Eu3+", "[Xe] 4f6") == (True, "")
+
+
+def test_aufbau_form_of_cation_is_flagged():
+    correct, feedback = grade_submission("Fe3+", "[Ar] 4s2 3d3")
+    assert not correct
+    assert feedback.startswith("cations lose electrons from the highest shell first")
+
+
+def test_wrong_electron_count():
+    correct, feedback = grade_submission("O2-", "1s2 2s2 2p4")
+    assert not correct
+    assert feedback.startswith("expected 10 electrons, got 8")
+
+
+def test_grade_csv_skips_only_the_header():
+    source = io.StringIO("student,species,submission\nStudent,Na,[Ne] 3s1\nAda,Fe3+,[Ar] 4s2 3d3\n")
+    output = io.StringIO()
+    grade_csv(source, output, workers=1)
+    rows = [line.split(",")[:4] for line in output.getvalue().splitlines()]
+    assert rows == [
+        ["student", "species", "submission", "correct"],
+        ["Student", "Na", "[Ne] 3s1", "yes"],
+        ["Ada", "Fe3+", "[Ar] 4s2 3d3", "no"],
+    ]
@@ -0,0 +1,24 @@
+import json
+
+import numpy as np
+
+from ingestion import get_ionization_energies, ingest_bowserinator, validate_configurations
+
+
+def test_ionization_energy_gaps_keep_their_position(tmp_path):
+    path = tmp_path / "elements.json"
+    path.write_text(json.dumps({"elements": [
+        {"number": 1, "ionization_energies": [1312.0], "electron_configuration": "1s1", "shells": [1]},
+        {"number": 3, "ionization_energies": [520.2, None, 11815.0], "electron_configuration": "1s2 2s1"},
+        {"number": 29, "electron_configuration": "[Ar] 3d10 4s1", "shells": [2, 8, 18, 1]},
+    ]}), encoding="utf-8")
+    columns = ingest_bowserinator(path)
+    assert get_ionization_energies(columns, 1).tolist() == [1312.0]
+    lithium = get_ionization_energies(columns, 3)
+    assert lithium[0] == 520.2 and np.isnan(lithium[1]) and lithium[2] == 11815.0
+    assert len(get_ionization_energies(columns, 2)) == 0
+
+    report = validate_configurations(columns)
+    assert report["mismatched"] == [29]
+    assert report["shell-mismatched"] == [29]
+    assert 1 not in report["unparsed"] and 2 in report["unparsed"]
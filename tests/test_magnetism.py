@@ -0,0 +1,19 @@
+import pytest
+
+from electrons import format_occupancy, get_ion_occupancy
+from magnetism import get_magnetic_properties
+
+
+@pytest.mark.parametrize(
+    "atomic_number, charge, unpaired",
+    [(26, 3, 5), (58, 3, 1), (63, 3, 6), (64, 3, 7), (58, 4, 0)],
+)
+def test_unpaired_electrons(atomic_number, charge, unpaired):
+    count, paramagnetic, _ = get_magnetic_properties(atomic_number, charge)
+    assert count == unpaired
+    assert paramagnetic == (unpaired > 0)
+
+
+def test_f_block_cations_keep_the_core_p_subshell():
+    assert format_occupancy(get_ion_occupancy(58, 3)).endswith("5p⁶ 4f¹")
+    assert format_occupancy(get_ion_occupancy(92, 3)).endswith("6p⁶ 5f³")
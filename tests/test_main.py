@@ -0,0 +1,77 @@
+import runpy
+import sys
+import types
+
+import pytest
+
+from conftest import ROOT
+
+
+class FakeWidget:
+    def __init__(self):
+        self.text = ""
+
+    def get(self):
+        return self.text
+
+    def configure(self, text):
+        self.text = text
+
+
+class FakeApp:
+    def __init__(self):
+        self.entry = FakeWidget()
+        self.output_label = FakeWidget()
+        self.settings = {}
+        self.on_button_clicked = lambda: None
+
+    def mainloop(self):
+        pass
+
+
+@pytest.fixture
+def run_gui(monkeypatch):
+    # main.py runs as __main__ in the app, so modules importing the engine must not load a second copy of it
+    monkeypatch.setitem(sys.modules, "ui", types.SimpleNamespace(App=FakeApp))
+    namespace = runpy.run_path(str(ROOT / "main.py"), run_name="__main__")
+
+    def run(text):
+        namespace["app"].entry.text = text
+        namespace["app"].on_button_clicked()
+        return namespace["app"].output_label.text
+
+    run.app = namespace["app"]
+    return run
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("1s3", "Subshell 1s holds at most 2 electrons."),
+        ("[Xe] 3s1", "Subshell 3s is given more than once."),
+        ("1s2 5g2", "Unrecognized configuration term: 5g2"),
+        ("1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p6 5s2 4d10 5p6 6s2 4f14 5d10 6p6 7s2 5f14 6d10 7p7", "Subshell 7p holds at most 6 electrons."),
+    ],
+)
+def test_configuration_errors_show_parser_message(run_gui, text, message):
+    assert run_gui(text) == message
+
+
+def test_configuration_lookup(run_gui):
+    assert run_gui("[Ne] 3s1").startswith("₁₁Na, ₁₀Ne⁻, ₁₂Mg⁺")
+    assert "₂₆Fe³⁺" in run_gui("[Ar] 3d5")
+
+
+def test_species_input(run_gui):
+    assert run_gui("Fe 3+") == "₂₆Fe³⁺: 1s² 2s² 2p⁶ 3s² 3p⁶ 3d⁵\n\n₂₆Fe³⁺: [₁₈Ar] 3d⁵"
+    assert run_gui("Ce3+").endswith("₅₈Ce³⁺: [₅₄Xe] 4f¹")
+    assert run_gui("O 2-").endswith("₈O²⁻: [₂He] 2s² 2p⁶")
+    assert run_gui("abc") == "Element not found in the periodic table: abc"
+    assert run_gui("H 1+") == "Number of electrons must be at least 1."
+
+
+def test_orbital_diagram_mode(run_gui):
+    assert "[↑↓]" not in run_gui("Fe")
+    run_gui.app.settings["orbital_diagram"] = True
+    assert run_gui("Fe").endswith("\n\n4s [↑↓]\n3d [↑↓][↑ ][↑ ][↑ ][↑ ]")
+    assert run_gui("Fe 3+").endswith("\n\n3d [↑ ][↑ ][↑ ][↑ ][↑ ]")
@@ -0,0 +1,40 @@
+import pytest
+
+from crystalfield import get_d_electron_count
+from oxidation import describe_oxidation_states
+
+
+def get_states(formula):
+    return sorted((atom["symbol"], atom["oxidation-state"], atom["count"]) for atom in describe_oxidation_states(formula))
+
+
+@pytest.mark.parametrize(
+    "formula, expected",
+    [
+        ("NH4NO3", [("H", 1, 4), ("N", -3, 1), ("N", 5, 1), ("O", -2, 3)]),
+        ("Fe3O4", [("Fe", 2, 1), ("Fe", 3, 2), ("O", -2, 4)]),
+        ("C2H6", [("C", -3, 2), ("H", 1, 6)]),
+        ("N2O", [("N", 1, 2), ("O", -2, 1)]),
+        ("NaH", [("H", -1, 1), ("Na", 1, 1)]),
+        ("K4[Fe(CN)6]", [("C", 2, 6), ("Fe", 2, 1), ("K", 1, 4), ("N", -3, 6)]),
+        ("C3H8", [("C", -3, 2), ("C", -2, 1), ("H", 1, 8)]),
+        ("Ni(CO)4", [("C", 2, 4), ("Ni", 0, 1), ("O", -2, 4)]),
+        ("Fe(CO)5", [("C", 2, 5), ("Fe", 0, 1), ("O", -2, 5)]),
+        ("CaC2", [("C", -1, 2), ("Ca", 2, 1)]),
+    ],
+)
+def test_oxidation_states(formula, expected):
+    assert get_states(formula) == expected
+
+
+def test_carbon_takes_a_fractional_average_state():
+    states = get_states("C60H122N20O30S5P3")
+    assert ("H", 1, 122) in states
+    assert ("O", -2, 30) in states
+    assert [(state, count) for symbol, state, count in states if symbol == "C"] == [(-1, 7), (0, 53)]
+
+
+def test_d_electron_counts_agree():
+    atoms = describe_oxidation_states("K3[Fe(CN)6]")
+    iron = next(atom for atom in atoms if atom["symbol"] == "Fe")
+    assert iron["d-electrons"] == get_d_electron_count(26, iron["oxidation-state"]) == 5
@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+
+from electrons import PhysicsError
+from packing import deduplicate_occupancies, encode_occupancy, pack_occupancies, packed_to_keys
+from species import OCCUPANCY_MATRIX
+
+
+def test_pack_matches_encode():
+    keys = packed_to_keys(pack_occupancies(OCCUPANCY_MATRIX[:50]))
+    assert keys == [encode_occupancy(occupancy) for occupancy in OCCUPANCY_MATRIX[:50].tolist()]
+
+
+def test_pack_rejects_overfull_subshells():
+    occupancies = np.zeros((2, OCCUPANCY_MATRIX.shape[1]), dtype=np.int64)
+    occupancies[1, 0] = 16
+    with pytest.raises(PhysicsError):
+        pack_occupancies(occupancies)
+    with pytest.raises(PhysicsError):
+        deduplicate_occupancies(-occupancies[::-1] // 16)
@@ -0,0 +1,16 @@
+import numpy as np
+
+from relativistic import JJ_ION_OCCUPANCY_MATRIX, get_jj_electron_configuration
+from species import SPECIES_ATOMIC_NUMBERS, SPECIES_CHARGES
+
+
+def test_relativistic_filling_order():
+    assert get_jj_electron_configuration(81).endswith("5d₅/₂⁶ 6p₁/₂¹")
+    assert get_jj_electron_configuration(103).endswith("7s₁/₂² 5f₅/₂⁶ 5f₇/₂⁸ 7p₁/₂¹")
+    assert get_jj_electron_configuration(118).endswith("7p₁/₂² 6d₃/₂⁴ 6d₅/₂⁶ 7p₃/₂⁴")
+
+
+def test_cations_lose_the_outermost_j_subshells():
+    assert get_jj_electron_configuration(92, 3).endswith("6p₃/₂⁴ 5f₅/₂³")
+    assert get_jj_electron_configuration(103, 1).endswith("6p₃/₂⁴ 7s₁/₂² 5f₅/₂⁶ 5f₇/₂⁸")
+    assert np.array_equal(JJ_ION_OCCUPANCY_MATRIX.sum(axis=1), SPECIES_ATOMIC_NUMBERS - SPECIES_CHARGES)
@@ -0,0 +1,16 @@
+from similarity import most_similar_elements, most_similar_species
+
+
+def test_most_similar_elements_excludes_the_query():
+    neighbors = most_similar_elements(11, k=117)
+    assert len(neighbors) == 117
+    assert 11 not in [atomic_number for atomic_number, _ in neighbors]
+    distances = [distance for _, distance in neighbors]
+    assert distances == sorted(distances)
+    assert neighbors[0][0] in (3, 19, 37, 55)
+
+
+def test_most_similar_species_beyond_the_neighbour_index():
+    near = most_similar_species(26, 3, k=5)
+    far = most_similar_species(26, 3, k=40)
+    assert [entry for entry, _ in far[:5]] == [entry for entry, _ in near]
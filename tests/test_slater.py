@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from electrons import ORBITALS
+from slater import ORBITAL_RADII, get_effective_nuclear_charge
+
+
+@pytest.mark.parametrize(
+    "atomic_number, charge, subshell, effective_charge",
+    [
+        (1, 0, (1, "s"), 1.0),
+        (2, 0, (1, "s"), 1.7),
+        (7, 0, (2, "p"), 3.9),
+        (11, 0, (3, "s"), 2.2),
+        (30, 0, (4, "s"), 4.35),
+        (30, 0, (3, "d"), 8.85),
+        (26, 0, (4, "s"), 3.75),
+    ],
+)
+def test_slater_rules(atomic_number, charge, subshell, effective_charge):
+    charges = get_effective_nuclear_charge(atomic_number, charge)
+    assert charges[ORBITALS.index(subshell)] == pytest.approx(effective_charge)
+
+
+def test_empty_subshells_have_no_value():
+    charges = get_effective_nuclear_charge(11)
+    assert np.isnan(charges[ORBITALS.index((3, "p"))])
+    assert np.isnan(ORBITAL_RADII).any()
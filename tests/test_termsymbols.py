@@ -0,0 +1,50 @@
+from math import comb
+
+import pytest
+
+from electrons import parse_electron_configuration
+from termsymbols import (
+    combine_microstates,
+    format_term_symbol,
+    get_ground_term,
+    get_microstates,
+    get_term_symbol,
+)
+
+
+@pytest.mark.parametrize("l, electron_count", [(1, 2), (2, 5), (3, 7)])
+def test_microstate_counts(l, electron_count):
+    histogram = dict(get_microstates(l, electron_count))
+    assert sum(histogram.values()) == comb(2 * (2 * l + 1), electron_count)
+    # The histogram is symmetric under M_L -> -M_L and M_S -> -M_S
+    assert all(histogram[-ml, -twice_ms] == count for (ml, twice_ms), count in histogram.items())
+
+
+def test_p2_microstates():
+    histogram = dict(get_microstates(1, 2))
+    # ¹D, ³P and ¹S: M_L = 2 only in ¹D, M_S = 1 only in ³P
+    assert histogram[2, 0] == 1
+    assert histogram[1, 2] == 1
+    assert histogram[0, 0] == 3
+
+
+def test_combined_microstates():
+    histogram = dict(combine_microstates(((2, 5), (0, 1))))
+    assert sum(histogram.values()) == comb(10, 5) * 2
+    assert max(twice_ms for _, twice_ms in histogram) == 6
+
+
+@pytest.mark.parametrize(
+    "electron_count, term",
+    [(1, "²S₁/₂"), (6, "³P₀"), (8, "³P₂"), (10, "¹S₀"), (26, "⁵D₄"), (64, "⁷F₆")],
+)
+def test_ground_terms(electron_count, term):
+    assert get_term_symbol(electron_count) == term
+
+
+@pytest.mark.parametrize(
+    "configuration, term",
+    [("[Ar] 3d5 4s1", "⁷S₃"), ("1s1 2s1", "³S₁"), ("[Ne] 3s1 3p1", "³P₀")],
+)
+def test_two_open_subshells(configuration, term):
+    assert format_term_symbol(get_ground_term(parse_electron_configuration(configuration))) == term
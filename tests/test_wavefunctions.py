@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+
+from wavefunctions import radial_probability_density, radial_wavefunction, radial_wavefunctions
+
+
+@pytest.mark.parametrize("n", range(1, 8))
+def test_radial_wavefunctions_are_normalized(n):
+    r = np.linspace(0, 40 * n * n, 200001)
+    for l in range(n):
+        assert np.trapezoid(radial_probability_density(n, l, r), r) == pytest.approx(1, abs=1e-6)
+
+
+def test_batch_matches_single_evaluation():
+    r = np.linspace(0, 30, 101)
+    combinations = [(1, 1, 0), (26, 3, 2), (1, 2, 1), (8, 2, 1)]
+    batch = radial_wavefunctions(combinations, r)
+    for row, (atomic_number, n, l) in zip(batch, combinations):
+        assert np.allclose(row, radial_wavefunction(n, l, r, atomic_number))
+    assert np.allclose(radial_wavefunctions(combinations, r, density=True), r**2 * batch**2)
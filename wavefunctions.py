@@ -0,0 +1,52 @@
+from functools import lru_cache
+from math import comb, factorial, sqrt
+
+import numpy as np
+
+from electrons import PhysicsError
+
+
+@lru_cache(maxsize=None)
+def get_radial_coefficients(n: int, l: int) -> tuple[float, np.ndarray]:
+    # Normalization and highest-power-first polynomial coefficients of L_{n-l-1}^{2l+1}(ρ)
+    degree, alpha = n - l - 1, 2 * l + 1
+    if degree < 0:
+        raise PhysicsError(f"l must be smaller than n, got n={n}, l={l}.")
+    coefficients = np.array(
+        [(-1) ** i * comb(degree + alpha, degree - i) / factorial(i) for i in range(degree, -1, -1)]
+    )
+    normalization = sqrt((2 / n) ** 3 * factorial(degree) / (2 * n * factorial(n + l)))
+    return normalization, coefficients
+
+
+def evaluate_radial_wavefunction(n: int, l: int, r: np.ndarray, charges) -> np.ndarray:
+    # r is in Bohr radii; R_nl for nuclear charge Z is Z^(3/2) R_nl(Zr) of hydrogen. r and charges broadcast
+    normalization, coefficients = get_radial_coefficients(n, l)
+    rho = 2 * charges * r / n
+    return charges**1.5 * normalization * rho**l * np.exp(-rho / 2) * np.polyval(coefficients, rho)
+
+
+def radial_wavefunction(n: int, l: int, r: np.ndarray, atomic_number: int = 1) -> np.ndarray:
+    return evaluate_radial_wavefunction(n, l, np.asarray(r, dtype=np.float64), atomic_number)
+
+
+def radial_probability_density(n: int, l: int, r: np.ndarray, atomic_number: int = 1) -> np.ndarray:
+    r = np.asarray(r, dtype=np.float64)
+    return r**2 * radial_wavefunction(n, l, r, atomic_number) ** 2
+
+
+def radial_wavefunctions(combinations, r: np.ndarray, density: bool = False) -> np.ndarray:
+    # One row per (Z, n, l); rows sharing (n, l) are evaluated together as a (Z × grid) block
+    combinations = list(combinations)
+    r = np.asarray(r, dtype=np.float64)
+    result = np.empty((len(combinations), len(r)))
+    groups = {}
+    for row, (atomic_number, n, l) in enumerate(combinations):
+        groups.setdefault((n, l), []).append((row, atomic_number))
+    for (n, l), members in groups.items():
+        rows = np.array([member[0] for member in members])
+        charges = np.array([member[1] for member in members], dtype=np.float64)[:, None]
+        values = evaluate_radial_wavefunction(n, l, r[None, :], charges)
+        result[rows] = r**2 * values**2 if density else values
+    return result
+